@@ -30,15 +30,18 @@ setup(
         "pdfplumber>=0.7.0",
         "PyPDF2>=3.0.0",
         "nltk>=3.8.0",
+        "numpy>=1.21.0",
         "python-pptx>=0.6.21",
         "pillow>=10.0.0",
-        "moviepy>=1.0.0",
         "imageio-ffmpeg>=0.4.0",
         "pyttsx3>=2.90",
         "pyyaml>=6.0.0",
         "click>=8.0.0",
     ],
     extras_require={
+        "fast": [
+            "pymupdf>=1.23.0",
+        ],
         "dev": [
             "pytest==7.4.4",
             "pytest-cov==4.1.0",
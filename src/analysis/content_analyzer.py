@@ -2,8 +2,9 @@
 Content Analyzer
 Analyzes content and ranks sections by importance
 """
+import heapq
 from typing import List, Dict, Any
-from collections import Counter
+import numpy as np
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 from utils.text_processor import TextProcessor
@@ -23,6 +24,7 @@ class ContentAnalyzer:
         self.config = config
         self.logger = logger
         self.text_processor = TextProcessor()
+        self.text_processor.warmup()
         self.max_slides = config.get_value('analysis.max_slides', 10)
     
     def split_into_sections(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -37,47 +39,56 @@ class ContentAnalyzer:
         """
         return doc.get('sections', [])
     
-    def calculate_importance_scores(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def calculate_importance_scores(self, sections: List[Dict[str, Any]], total_pages: int) -> List[Dict[str, Any]]:
         """
         Calculate importance scores for sections
         
         Args:
             sections: List of sections
+            total_pages: Page count of the source document (0 if unknown)
             
         Returns:
             Sections with importance scores
         """
-        scored_sections = []
+        # Join each section's text once and reuse it for every factor
+        texts = [' '.join(section.get('paragraphs', [])) for section in sections]
+        count = len(sections)
         
-        for section in sections:
-            text = ' '.join(section.get('paragraphs', []))
-            
-            # Calculate score based on multiple factors
-            word_count = self.text_processor.word_count(text)
-            
-            # Factor 1: Length (longer = more important)
-            length_score = min(word_count / 100, 1.0)
-            
-            # Factor 2: Keyword density
-            keywords = self.text_processor.extract_keywords(text, n=10)
-            keyword_score = min(len(keywords) / 10, 1.0)
-            
-            # Factor 3: Position (earlier = more important)
-            position = section.get('page_numbers', [])
-            if position:
-                page_num = min(position)
-                total_pages = 50  # Approximate
-                position_score = 1.0 - min(page_num / total_pages, 1.0)
-            else:
-                position_score = 0.5
-            
-            # Combined score
-            importance_score = (length_score * 0.4) + (keyword_score * 0.3) + (position_score * 0.3)
-            
+        # Factor 1: Length (longer = more important)
+        # Whitespace split is plenty for a score that saturates at 100 words
+        word_counts = np.fromiter((len(text.split()) for text in texts), dtype=np.float64, count=count)
+        length_scores = np.minimum(word_counts / 100, 1.0)
+        
+        # Factor 2: Keyword density (extract_keywords memoizes repeated texts)
+        keyword_counts = np.fromiter(
+            (len(self.text_processor.extract_keywords(text, n=10)) for text in texts),
+            dtype=np.float64, count=count
+        )
+        keyword_scores = np.minimum(keyword_counts / 10, 1.0)
+        
+        # Factor 3: Position (earlier = more important), 0.5 when the page
+        # or the document's page count is unknown
+        if total_pages > 0:
+            first_pages = np.fromiter(
+                (min(section['page_numbers']) if section.get('page_numbers') else -1 for section in sections),
+                dtype=np.float64, count=count
+            )
+            inv_total = 1.0 / total_pages
+            position_scores = np.where(
+                first_pages >= 0,
+                1.0 - np.minimum(first_pages * inv_total, 1.0),
+                0.5
+            )
+        else:
+            position_scores = np.full(count, 0.5)
+        
+        # Combined score
+        importance_scores = (length_scores * 0.4) + (keyword_scores * 0.3) + (position_scores * 0.3)
+        
+        for section, importance_score in zip(sections, importance_scores.tolist()):
             section['importance_score'] = importance_score
-            scored_sections.append(section)
         
-        return scored_sections
+        return list(sections)
     
     def rank_sections(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -97,28 +108,23 @@ class ContentAnalyzer:
             self.logger.warning("No sections found in document")
             return []
         
+        # Nothing would be dropped, so skip scoring entirely
+        if len(sections) <= self.max_slides:
+            self.logger.info(f"Short document: keeping all {len(sections)} sections")
+            return sections
+        
         # Calculate importance scores
-        scored_sections = self.calculate_importance_scores(sections)
-        
-        # Keep original order (don't sort by importance)
-        # Select top N sections based on importance but preserve their original order
-        # First, identify the top N by importance
-        sorted_by_importance = sorted(scored_sections, key=lambda x: x.get('importance_score', 0), reverse=True)
-        top_important = sorted_by_importance[:self.max_slides]
-        
-        # Get the page numbers of top important sections
-        top_page_numbers = {min(s.get('page_numbers', [999])) for s in top_important if s.get('page_numbers')}
-        
-        # Now get those sections in their original order
-        selected = []
-        seen_pages = set()
-        for section in scored_sections:
-            page_num = min(section.get('page_numbers', [999])) if section.get('page_numbers') else 999
-            if page_num in top_page_numbers and page_num not in seen_pages:
-                selected.append(section)
-                seen_pages.add(page_num)
-                if len(selected) >= self.max_slides:
-                    break
+        total_pages = doc.get('metadata', {}).get('total_pages', 0)
+        scored_sections = self.calculate_importance_scores(sections, total_pages)
+        
+        # Select top N sections by importance but preserve their original order:
+        # pick the top N indices in one O(N log max_slides) pass, then restore document order
+        top = heapq.nlargest(
+            self.max_slides,
+            enumerate(scored_sections),
+            key=lambda item: item[1].get('importance_score', 0)
+        )
+        selected = [scored_sections[i] for i in sorted(i for i, _ in top)]
         
         self.logger.info(f"Selected {len(selected)} sections for slides")
         
@@ -2,11 +2,72 @@
 Pipeline Orchestrator
 Coordinates all pipeline stages
 """
+import asyncio
+import multiprocessing
+import pickle
+import sys
 import time
 import os
-from typing import Dict, Any, Optional
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Tuple, Callable, Iterator
+
+# Make the stage packages importable once, at module load
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
 from utils.logger import Logger
 from utils.config_manager import ConfigManager
+from utils.file_manager import FileManager
+from extraction.pdf_extractor import PDFExtractor
+from analysis.content_analyzer import ContentAnalyzer
+from summarization.summarizer import Summarizer
+from visual.visual_generator import VisualGenerator
+from slide.slide_assembler import SlideAssembler
+from video.video_generator import VideoGenerator
+
+# Max items buffered between streaming stages
+QUEUE_SIZE = 2
+
+# End-of-stream marker passed through the stage queues
+_EOF = object()
+
+# Put on a stage queue when the pipeline fails, so a consumer thread stops
+_ABORT = object()
+
+# Bump when the extractor output changes so stale cache entries are ignored
+EXTRACTION_CACHE_VERSION = 3
+
+# Stage objects owned by a pool worker process (built once by _init_worker)
+_worker_summarizer = None
+_worker_visual_generator = None
+
+
+def _init_worker(config_dict: Dict[str, Any]) -> None:
+    """
+    Build the per-section stage objects inside a pool worker process
+    
+    ConfigManager and Logger are rebuilt here rather than pickled, so only
+    the plain configuration dictionary crosses the process boundary.
+    
+    Args:
+        config_dict: Loaded configuration dictionary
+    """
+    global _worker_summarizer, _worker_visual_generator
+    config = ConfigManager.from_dict(config_dict)
+    logger = Logger()
+    _worker_summarizer = Summarizer(config, logger)
+    _worker_visual_generator = VisualGenerator(config, logger)
+
+
+def _summarize_one(section: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize one section in a pool worker"""
+    return _worker_summarizer.summarize_section(section)
+
+
+def _visualize_one(slide: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Generate the visual for one slide in a pool worker"""
+    return _worker_visual_generator.generate_for_slide(slide, index)
 
 
 class PipelineOrchestrator:
@@ -23,6 +84,12 @@ class PipelineOrchestrator:
         self.config = config_manager
         self.logger = logger
         self.start_time = None
+        
+        # Workers for the per-section stages: 1 = serial, 0 = one per CPU core
+        workers = config_manager.get_value('analysis.parallel_workers', 1)
+        self.parallel_workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._pool = None
+        self._out: Optional[Path] = None
     
     def execute_pipeline(self, pdf_path: str, output_dir: str) -> Dict[str, Any]:
         """
@@ -38,54 +105,16 @@ class PipelineOrchestrator:
         self.start_time = time.time()
         
         try:
-            # Stage 1: PDF Extraction
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 1: PDF Extraction")
-            self.logger.info("=" * 60)
-            
-            document_structure = self._stage_1_extraction(pdf_path)
-            
-            # Stage 2: Content Analysis
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 2: Content Analysis")
-            self.logger.info("=" * 60)
-            
-            ranked_sections = self._stage_2_analysis(document_structure)
+            # Resolved and created once; stages build their paths from it
+            self._out = Path(output_dir)
+            self._out.mkdir(parents=True, exist_ok=True)
             
-            # Stage 3: Summarization
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 3: Summarization")
-            self.logger.info("=" * 60)
-            
-            slide_contents = self._stage_3_summarization(ranked_sections)
-            
-            # Stage 4: Visual Generation
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 4: Visual Generation")
-            self.logger.info("=" * 60)
-            
-            enriched_slides = self._stage_4_visual_generation(slide_contents)
-            
-            # Stage 5: Slide Assembly
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 5: Slide Assembly")
-            self.logger.info("=" * 60)
-            
-            presentation = self._stage_5_slide_assembly(enriched_slides, output_dir)
-            
-            # Stage 6: Video Generation
-            self.logger.info("=" * 60)
-            self.logger.info("STAGE 6: Video Generation")
-            self.logger.info("=" * 60)
-            
-            video_path = self._stage_6_video_generation(presentation, output_dir)
+            presentation, video_path = asyncio.run(self._run_pipeline(pdf_path))
             
             # Calculate total duration
             total_duration = time.time() - self.start_time
             
-            self.logger.info("=" * 60)
-            self.logger.info(f"Pipeline completed in {total_duration:.2f} seconds")
-            self.logger.info("=" * 60)
+            self._banner(f"Pipeline completed in {total_duration:.2f} seconds")
             
             return {
                 'status': 'success',
@@ -103,67 +132,229 @@ class PipelineOrchestrator:
                 'duration': duration
             }
     
-    def _stage_1_extraction(self, pdf_path: str) -> Dict[str, Any]:
-        """Stage 1: Extract PDF content"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from extraction.pdf_extractor import PDFExtractor
+    def _banner(self, title: str) -> None:
+        """Log a stage banner as a single record"""
+        separator = "=" * 60
+        self.logger.info(f"{separator}\n{title}\n{separator}")
+    
+    async def _run_pipeline(self, pdf_path: str) -> Tuple[str, str]:
+        """
+        Run the stages as an asyncio task graph
+        
+        Extraction and analysis need the whole document, and video generation
+        needs the finished presentation, so those run as single steps. Stages
+        3-5 are independent per section and stream through bounded queues, so
+        slide N+1 is summarized while slide N gets its visual.
+        
+        Args:
+            pdf_path: Path to input PDF
+            
+        Returns:
+            Tuple of (presentation path, video path)
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Stage 1: PDF Extraction
+        self._banner("STAGE 1: PDF Extraction")
+        
+        document_structure = await loop.run_in_executor(None, self._stage_1_extraction, pdf_path)
         
+        # Stage 2: Content Analysis
+        self._banner("STAGE 2: Content Analysis")
+        
+        ranked_sections = await loop.run_in_executor(None, self._stage_2_analysis, document_structure)
+        
+        # Stages 3-5: Summarization -> Visual Generation -> Slide Assembly
+        self._banner("STAGES 3-5: Summarization, Visual Generation, Slide Assembly")
+        
+        # Bounded queues give backpressure so fast stages can't run ahead
+        section_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        slide_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        enriched_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        
+        if self.parallel_workers > 1:
+            self.logger.info(f"Using {self.parallel_workers} worker processes for stages 3-4")
+            # Spawned, not forked: executor threads already exist here, and
+            # forking a multi-threaded process can copy locks held mid-use.
+            # _init_worker rebuilds everything from the plain config dict.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.parallel_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.config.get_config(),)
+            )
+        
+        tasks = [
+            asyncio.ensure_future(self._feed_sections(ranked_sections, section_queue)),
+            asyncio.ensure_future(self._stage_3_summarization(section_queue, slide_queue)),
+            asyncio.ensure_future(self._stage_4_visual_generation(slide_queue, enriched_queue)),
+            asyncio.ensure_future(self._stage_5_slide_assembly(enriched_queue)),
+        ]
+        try:
+            _, _, _, presentation = await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would leave its neighbours blocked on their queues
+            for task in tasks[:-1]:
+                task.cancel()
+            # Slide assembly reads its queue from a worker thread that task
+            # cancellation can't reach, so stop it through the queue itself and
+            # leave its task running until that thread has actually returned
+            while not enriched_queue.empty():
+                enriched_queue.get_nowait()
+            enriched_queue.put_nowait(_ABORT)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        
+        # Stage 6: Video Generation
+        self._banner("STAGE 6: Video Generation")
+        
+        video_path = await loop.run_in_executor(None, self._stage_6_video_generation, presentation)
+        
+        return presentation, video_path
+    
+    async def _feed_sections(self, sections: list, out_queue: asyncio.Queue) -> None:
+        """Push ranked sections into the streaming stages one at a time"""
+        for section in sections:
+            await out_queue.put(section)
+        await out_queue.put(_EOF)
+    
+    async def _pump(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue,
+                    submit: Callable[[Any, int], 'asyncio.Future']) -> None:
+        """
+        Move items between stage queues through submit(item, index)
+        
+        Up to parallel_workers calls are kept in flight; results are emitted
+        in input order.
+        
+        Args:
+            in_queue: Upstream queue
+            out_queue: Downstream queue
+            submit: Starts the work for one item and returns an awaitable
+        """
+        pending = deque()
+        index = 0
+        
+        while True:
+            item = await in_queue.get()
+            if item is _EOF:
+                break
+            pending.append(submit(item, index))
+            index += 1
+            if len(pending) >= self.parallel_workers:
+                await out_queue.put(await pending.popleft())
+        
+        while pending:
+            await out_queue.put(await pending.popleft())
+        
+        await out_queue.put(_EOF)
+    
+    def _stage_1_extraction(self, pdf_path: str) -> Dict[str, Any]:
+        """Stage 1: Extract PDF content (cached by PDF content hash)"""
         extractor = PDFExtractor(self.config, self.logger)
-        return extractor.extract_text_structure(pdf_path)
+        
+        cache_path = None
+        if self.config.get_value('extraction.cache_enabled', True):
+            digest = FileManager.file_sha256(pdf_path)
+            cache_path = os.path.join(
+                FileManager.get_cache_directory(),
+                f"{digest}_{extractor.backend.name}_v{EXTRACTION_CACHE_VERSION}.pkl"
+            )
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path, 'rb') as f:
+                        document_structure = pickle.load(f)
+                    self.logger.info(f"Loaded cached extraction: {cache_path}")
+                    return document_structure
+                except Exception as e:
+                    self.logger.warning(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+        
+        document_structure = extractor.extract_text_structure(pdf_path)
+        
+        if cache_path:
+            try:
+                # Write to a temp file first so a crash never leaves a truncated entry
+                temp_path = f"{cache_path}.tmp"
+                with open(temp_path, 'wb') as f:
+                    pickle.dump(document_structure, f, protocol=5)
+                os.replace(temp_path, cache_path)
+            except Exception as e:
+                self.logger.warning(f"Could not write extraction cache: {e}")
+        
+        return document_structure
     
     def _stage_2_analysis(self, doc: Dict[str, Any]) -> list:
         """Stage 2: Analyze and rank content"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from analysis.content_analyzer import ContentAnalyzer
-        
         analyzer = ContentAnalyzer(self.config, self.logger)
         return analyzer.rank_sections(doc)
     
-    def _stage_3_summarization(self, sections: list) -> list:
+    async def _stage_3_summarization(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
         """Stage 3: Create slide content"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from summarization.summarizer import Summarizer
+        loop = asyncio.get_running_loop()
+        
+        if self._pool is not None:
+            submit = lambda section, _: loop.run_in_executor(self._pool, _summarize_one, section)
+        else:
+            summarizer = Summarizer(self.config, self.logger)
+            submit = lambda section, _: loop.run_in_executor(None, summarizer.summarize_section, section)
         
-        summarizer = Summarizer(self.config, self.logger)
-        return [summarizer.summarize_section(section) for section in sections]
+        await self._pump(in_queue, out_queue, submit)
     
-    def _stage_4_visual_generation(self, slides: list) -> list:
+    async def _stage_4_visual_generation(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
         """Stage 4: Add visuals to slides"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from visual.visual_generator import VisualGenerator
+        loop = asyncio.get_running_loop()
         
-        generator = VisualGenerator(self.config, self.logger)
-        return generator.generate_for_slides(slides)
+        if self._pool is not None:
+            submit = lambda slide, index: loop.run_in_executor(self._pool, _visualize_one, slide, index)
+        else:
+            generator = VisualGenerator(self.config, self.logger)
+            submit = lambda slide, index: loop.run_in_executor(None, generator.generate_for_slide, slide, index)
+        
+        await self._pump(in_queue, out_queue, submit)
+        self.logger.info("Visual generation complete")
     
-    def _stage_5_slide_assembly(self, slides: list, output_dir: str) -> str:
+    async def _stage_5_slide_assembly(self, in_queue: asyncio.Queue) -> str:
         """Stage 5: Create PowerPoint presentation"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from slide.slide_assembler import SlideAssembler
-        
+        loop = asyncio.get_running_loop()
         assembler = SlideAssembler(self.config, self.logger)
-        output_path = f"{output_dir}/slides.pptx"
-        assembler.create_presentation(slides, output_path)
+        output_path = str(self._out / 'slides.pptx')
+        await loop.run_in_executor(
+            None, assembler.create_presentation, self._iter_queue(in_queue, loop), output_path
+        )
         return output_path
     
-    def _stage_6_video_generation(self, presentation_path: str, output_dir: str) -> str:
-        """Stage 6: Generate video"""
-        import sys
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        from video.video_generator import VideoGenerator
+    @staticmethod
+    def _iter_queue(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> Iterator[Any]:
+        """
+        Yield items from an asyncio queue inside a worker thread until _EOF
         
+        Lets synchronous consumers (the slide assembler) take items one at a
+        time as upstream stages produce them.
+        
+        Raises:
+            RuntimeError: If the pipeline was aborted upstream
+        """
+        while True:
+            item = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+            if item is _EOF:
+                return
+            if item is _ABORT:
+                raise RuntimeError("Pipeline aborted by an earlier stage")
+            yield item
+    
+    def _stage_6_video_generation(self, presentation_path: str) -> str:
+        """Stage 6: Generate video"""
         generator = VideoGenerator(self.config, self.logger)
         
         # Determine output path based on format
         video_format = self.config.get_value('video.output_format', 'mp4')
         if video_format == 'gif':
-            output_path = f"{output_dir}/video.gif"
+            output_path = str(self._out / 'video.gif')
         else:
-            output_path = f"{output_dir}/video.mp4"
+            output_path = str(self._out / 'video.mp4')
         
         generator.create_video(presentation_path, output_path)
         return output_path
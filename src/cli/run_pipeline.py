@@ -1,12 +1,13 @@
 """
 Main CLI entry point for the pipeline
 """
-import argparse
 import sys
 import os
 import logging
 from pathlib import Path
 
+import click
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -15,96 +16,179 @@ from utils.file_manager import FileManager
 from utils.config_manager import ConfigManager
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description='Visual Explanation Prototype - Convert PDF to Slides and Video'
-    )
-    
-    parser.add_argument(
-        '-i', '--input',
-        required=True,
-        help='Path to input PDF file'
-    )
-    
-    parser.add_argument(
-        '-o', '--outdir',
-        default='output',
-        help='Output directory (default: output/)'
-    )
-    
-    parser.add_argument(
-        '-c', '--config',
-        default='config/config.yaml',
-        help='Config file path (default: config/config.yaml)'
-    )
-    
-    parser.add_argument(
-        '--max-slides',
-        type=int,
-        default=10,
-        help='Maximum number of slides (default: 10)'
-    )
-    
-    parser.add_argument(
-        '--video-format',
-        choices=['mp4', 'gif'],
-        default='mp4',
-        help='Output video format: mp4 or gif (default: mp4)'
-    )
-    
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose logging'
-    )
-    
-    args = parser.parse_args()
+class _DefaultGroup(click.Group):
+    """Group that falls back to the `run` command so `run_pipeline.py -i x.pdf` keeps working"""
+    
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = ['run'] + list(args)
+        return super().parse_args(ctx, args)
+
+
+def _common_options(func):
+    """Options shared by the run and batch commands"""
+    options = [
+        click.option('-o', '--outdir', default='output', show_default=True,
+                     help='Output directory'),
+        click.option('-c', '--config', 'config_path', default='config/config.yaml', show_default=True,
+                     help='Config file path'),
+        click.option('--max-slides', type=int, default=10, show_default=True,
+                     help='Maximum number of slides'),
+        click.option('--video-format', type=click.Choice(['mp4', 'gif']), default='mp4', show_default=True,
+                     help='Output video format'),
+        click.option('--no-cache', is_flag=True,
+                     help='Re-extract the PDF even if a cached result exists'),
+        click.option('-v', '--verbose', is_flag=True,
+                     help='Enable verbose logging'),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def _warmup_nltk(logger: Logger) -> None:
+    """
+    Fetch and load NLTK data once before the pipeline starts
+    
+    Keeps corpus downloads and disk reads out of the analysis stage, and
+    worker processes forked later inherit the loaded stopwords.
+    """
+    # Project-local data dir so downloaded corpora survive re-runs;
+    # must be set before nltk is first imported
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    data_dir = os.environ.setdefault('NLTK_DATA', os.path.join(project_root, 'nltk_data'))
+    
+    try:
+        import nltk
+        # Only hit the network for corpora that aren't installed yet
+        for package, resource in (('punkt', 'tokenizers/punkt'), ('stopwords', 'corpora/stopwords')):
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, download_dir=data_dir, quiet=True)
+        from nltk.corpus import stopwords
+        stopwords.words('english')
+    except Exception as e:
+        logger.warning(f"NLTK warmup failed, data will be loaded on first use: {e}")
+
+
+def _setup(config_path: str, max_slides: int, video_format: str, no_cache: bool, verbose: bool):
+    """
+    Initialize logger and configuration with command-line overrides
     
+    Returns:
+        Tuple of (logger, config_manager)
+    """
     # Initialize logger
     logger = Logger()
-    if args.verbose:
+    if verbose:
         logger.logger.setLevel(logging.DEBUG)
     
-    logger.info("Starting Visual Explanation Prototype Pipeline")
+    _warmup_nltk(logger)
     
-    # Validate input file
-    if not FileManager.validate_pdf_file(args.input):
-        logger.error(f"Invalid PDF file: {args.input}")
-        sys.exit(1)
+    logger.info("Starting Visual Explanation Prototype Pipeline")
     
     # Load configuration
-    config_manager = ConfigManager(args.config)
+    config_manager = ConfigManager(config_path)
     config_manager.validate_config()
     
     # Override max_slides if specified
-    if 'analysis' not in config_manager.config:
-        config_manager.config['analysis'] = {}
-    config_manager.config['analysis']['max_slides'] = args.max_slides
+    config_manager.set_value('analysis.max_slides', max_slides)
     
     # Override video format if specified
-    if 'video' not in config_manager.config:
-        config_manager.config['video'] = {}
-    config_manager.config['video']['output_format'] = args.video_format
+    config_manager.set_value('video.output_format', video_format)
+    
+    # Disable the extraction cache if requested
+    if no_cache:
+        config_manager.set_value('extraction.cache_enabled', False)
+    
+    return logger, config_manager
+
+
+def _process(orchestrator, logger: Logger, pdf_path: str, output_dir: str) -> bool:
+    """
+    Run the pipeline for one PDF and log the outcome
+    
+    Returns:
+        True if successful
+    """
+    result = orchestrator.execute_pipeline(pdf_path, output_dir)
+    
+    if result['status'] == 'success':
+        logger.info("Pipeline completed successfully!")
+        logger.info(f"Slides: {result.get('slides_path', 'N/A')}")
+        logger.info(f"Video: {result.get('video_path', 'N/A')}")
+        return True
+    
+    logger.error(f"Pipeline failed: {result.get('error_message', 'Unknown error')}")
+    return False
+
+
+@click.group(cls=_DefaultGroup, context_settings={'help_option_names': ['-h', '--help']})
+def main():
+    """Visual Explanation Prototype - Convert PDF to Slides and Video"""
+
+
+@main.command()
+@click.option('-i', '--input', 'input_path', required=True, help='Path to input PDF file')
+@_common_options
+def run(input_path, outdir, config_path, max_slides, video_format, no_cache, verbose):
+    """Convert a single PDF"""
+    logger, config_manager = _setup(config_path, max_slides, video_format, no_cache, verbose)
+    
+    # Validate input file
+    if not FileManager.validate_pdf_file(input_path):
+        logger.error(f"Invalid PDF file: {input_path}")
+        sys.exit(1)
     
     # Create output directory
-    output_dir = FileManager.create_output_directory(args.outdir)
+    output_dir = FileManager.create_output_directory(outdir)
     
     try:
         # Import and run pipeline
         from orchestrator import PipelineOrchestrator
         
         orchestrator = PipelineOrchestrator(config_manager, logger)
-        result = orchestrator.execute_pipeline(args.input, output_dir)
+        sys.exit(0 if _process(orchestrator, logger, input_path, output_dir) else 1)
+    
+    except Exception as e:
+        logger.error(f"Fatal error: {str(e)}")
+        import traceback
+        logger.debug(traceback.format_exc())
+        sys.exit(1)
+
+
+@main.command()
+@click.argument('input_dir', type=click.Path(exists=True, file_okay=False))
+@_common_options
+def batch(input_dir, outdir, config_path, max_slides, video_format, no_cache, verbose):
+    """Convert every PDF in INPUT_DIR, writing each to OUTDIR/<pdf name>/"""
+    logger, config_manager = _setup(config_path, max_slides, video_format, no_cache, verbose)
+    
+    pdf_paths = sorted(str(p) for p in Path(input_dir).glob('*.pdf'))
+    if not pdf_paths:
+        logger.error(f"No PDF files found in: {input_dir}")
+        sys.exit(1)
+    
+    try:
+        # One orchestrator for all files so imports and models load once
+        from orchestrator import PipelineOrchestrator
         
-        if result['status'] == 'success':
-            logger.info("Pipeline completed successfully!")
-            logger.info(f"Slides: {result.get('slides_path', 'N/A')}")
-            logger.info(f"Video: {result.get('video_path', 'N/A')}")
-            sys.exit(0)
-        else:
-            logger.error(f"Pipeline failed: {result.get('error_message', 'Unknown error')}")
-            sys.exit(1)
+        orchestrator = PipelineOrchestrator(config_manager, logger)
+        failed = []
+        for pdf_path in pdf_paths:
+            if not FileManager.validate_pdf_file(pdf_path):
+                logger.error(f"Invalid PDF file: {pdf_path}")
+                failed.append(pdf_path)
+                continue
+            
+            logger.info(f"Processing {pdf_path}")
+            output_dir = FileManager.create_output_directory(os.path.join(outdir, Path(pdf_path).stem))
+            if not _process(orchestrator, logger, pdf_path, output_dir):
+                failed.append(pdf_path)
+        
+        logger.info(f"Batch complete: {len(pdf_paths) - len(failed)}/{len(pdf_paths)} succeeded")
+        sys.exit(1 if failed else 0)
     
     except Exception as e:
         logger.error(f"Fatal error: {str(e)}")
@@ -115,4 +199,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
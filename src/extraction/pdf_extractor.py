@@ -2,11 +2,233 @@
 PDF Extractor
 Extracts structured text from PDF files
 """
+import multiprocessing
+import os
+import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
 import pdfplumber
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, Iterator
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 
+try:
+    import fitz  # PyMuPDF - optional fast backend (pip install .[fast])
+except ImportError:
+    fitz = None
+
+# Below this many pages, worker start-up costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+# Characters sampled per page for font-size analysis
+FONT_SAMPLE_CHARS = 2000
+
+
+class _PdfplumberBackend:
+    """Layout-aware backend built on pdfplumber (slower, keeps tables/coordinates)"""
+    
+    name = 'pdfplumber'
+    
+    def open(self, pdf_path: str):
+        return pdfplumber.open(pdf_path)
+    
+    def pages(self, pdf) -> list:
+        return pdf.pages
+    
+    def page_words(self, page) -> List[Dict[str, Any]]:
+        # Font attributes come back with the words in the same pass
+        return page.extract_words(extra_attrs=['size', 'fontname'], keep_blank_chars=False)
+    
+    def char_sizes(self, page, max_chars: int) -> np.ndarray:
+        # Stride through the chars so dense pages cost no more than max_chars lookups
+        chars = page.chars[::max(1, len(page.chars) // max_chars)]
+        return np.fromiter((char.get('size', 0) for char in chars), dtype=np.float32, count=len(chars))
+    
+    def close(self, pdf) -> None:
+        pdf.close()
+
+
+class _PyMuPDFBackend:
+    """Fast text and font backend built on PyMuPDF"""
+    
+    name = 'pymupdf'
+    
+    def open(self, pdf_path: str):
+        return fitz.open(pdf_path)
+    
+    def pages(self, pdf) -> list:
+        return list(pdf)
+    
+    def page_words(self, page) -> List[Dict[str, Any]]:
+        # Spans carry font size and name; split them into words with the same
+        # keys pdfplumber's extract_words(extra_attrs=['size', 'fontname']) returns
+        words = []
+        for block in page.get_text("dict").get('blocks', []):
+            for line in block.get('lines', []):
+                for span in line.get('spans', []):
+                    x0, top, x1, bottom = span['bbox']
+                    size = span.get('size', 0)
+                    fontname = span.get('font', '')
+                    for text in span.get('text', '').split():
+                        words.append({
+                            'text': text, 'x0': x0, 'top': top, 'x1': x1, 'bottom': bottom,
+                            'size': size, 'fontname': fontname
+                        })
+        return words
+    
+    def char_sizes(self, page, max_chars: int) -> np.ndarray:
+        # One size per span, repeated for each character in the span
+        span_sizes = []
+        span_lengths = []
+        for block in page.get_text("dict").get('blocks', []):
+            for line in block.get('lines', []):
+                for span in line.get('spans', []):
+                    span_sizes.append(span.get('size', 0))
+                    span_lengths.append(len(span.get('text', '')))
+        sizes = np.repeat(np.asarray(span_sizes, dtype=np.float32), span_lengths)
+        return sizes[::max(1, sizes.size // max_chars)]
+    
+    def close(self, pdf) -> None:
+        pdf.close()
+
+
+# Font names that mark headings, and punctuation that rules them out mid-line
+_HEADING_FONT_RE = re.compile(r'bold|black|heavy|extrabold', re.IGNORECASE)
+_MIDTEXT_PUNCT_RE = re.compile(r'[.!?,]')
+
+# _classify_heading result codes
+_NOT_HEADING = 0
+_HEADING_BY_SIZE = 1
+_HEADING_BY_WEIGHT = 2
+_HEADING_BY_TEXT = 3
+
+
+@lru_cache(maxsize=4096)
+def _classify_heading(text: str, above_threshold: bool, fontname: str, has_size: bool) -> int:
+    """
+    Classify a line as heading or body text from its font properties
+    
+    Pure and cached: running headers and repeated section labels recur on
+    every page. The size comparisons are done exactly by the caller, so the
+    cache key holds only their outcome. Logging is left to the caller.
+    
+    Args:
+        text: Line text
+        above_threshold: Whether the font size is above the heading threshold
+        fontname: Font name
+        has_size: Whether the line has font size information
+        
+    Returns:
+        One of the _NOT_HEADING / _HEADING_BY_* codes
+    """
+    if not text or len(text) < 3:
+        return _NOT_HEADING
+    
+    # Check if font size is significantly larger than body text
+    if above_threshold:
+        return _HEADING_BY_SIZE
+    
+    # Check if font name suggests bold or heading
+    if _HEADING_FONT_RE.search(fontname):
+        return _HEADING_BY_WEIGHT
+    
+    # Fallback to heuristics if font info is not available
+    if not has_size:
+        return _HEADING_BY_TEXT if _is_heading_text(text) else _NOT_HEADING
+    
+    # Check if text is short and title case
+    if len(text) < 150:
+        if text.istitle() and len(text) < 100:
+            return _HEADING_BY_TEXT
+        
+        # Check for all caps (common in headings)
+        if text.isupper() and len(text) < 80:
+            return _HEADING_BY_TEXT
+    
+    return _NOT_HEADING
+
+
+def _is_heading_text(text: str) -> bool:
+    """
+    Generic heuristic to detect if text is a heading (fallback method)
+    Uses text characteristics rather than keywords for generic detection
+    
+    Args:
+        text: Text to check
+        
+    Returns:
+        True if likely a heading
+    """
+    if not text or len(text) < 3:
+        return False
+    
+    text_len = len(text)
+    
+    # Every rule below needs text under 150 chars; long body lines (the
+    # common case) exit here without any per-character scans
+    if text_len >= 150:
+        return False
+    
+    words = text.split()
+    word_count = len(words)
+    
+    # Very short text (likely heading)
+    if text_len < 20 and word_count < 5:
+        return True
+    
+    # Short text in title case (common heading pattern)
+    # Cheap length checks first so istitle()/isupper() only scan short text
+    if text_len < 100 and word_count < 10 and text.istitle():
+        return True
+    
+    # All caps text that's not too long (common in headings)
+    if text_len < 80 and word_count < 12 and text.isupper():
+        return True
+    
+    # Text with multiple capitalized words (heading pattern)
+    if word_count < 8 and text_len < 80:
+        capitalized_count = sum(1 for w in words if w[0].isupper())
+        # If most words are capitalized
+        if capitalized_count >= word_count * 0.7:
+            return True
+    
+    # Short lines ending with colon (common heading pattern)
+    if text_len < 100 and text.endswith(':'):
+        return True
+    
+    # Very short text relative to typical paragraph length
+    if word_count < 15:
+        # Additional check: no sentence-ending punctuation in middle
+        # (headings rarely have periods, question marks, etc. in the middle)
+        mid_text = text[10:-10] if text_len > 20 else text
+        if not _MIDTEXT_PUNCT_RE.search(mid_text):
+            return True
+        
+    return False
+
+
+def _extract_page_chunk(pdf_path: str, library: str, page_indices: range) -> List[List[Dict[str, Any]]]:
+    """
+    Worker entry point: open the PDF and extract paragraphs for a run of pages
+    
+    Args:
+        pdf_path: Path to PDF file
+        library: Backend name to use in the worker
+        page_indices: Zero-based page indices to process
+        
+    Returns:
+        Paragraph lists, one per page, in page order
+    """
+    extractor = PDFExtractor(ConfigManager.from_dict({'extraction': {'library': library}}), Logger())
+    pdf = extractor.load_pdf(pdf_path)
+    try:
+        pages = extractor.backend.pages(pdf)
+        return [extractor._extract_page_paragraphs(pages[i]) for i in page_indices]
+    finally:
+        extractor.backend.close(pdf)
+
 
 class PDFExtractor:
     """Extracts text from PDF files"""
@@ -21,6 +243,17 @@ class PDFExtractor:
         """
         self.config = config
         self.logger = logger
+        
+        # Text-only extraction defaults to PyMuPDF; pdfplumber stays available
+        # for layout-heavy documents and when PyMuPDF isn't installed
+        library = config.get_value('extraction.library', 'pymupdf')
+        if library == 'pymupdf' and fitz is None:
+            self.logger.debug("PyMuPDF not installed, falling back to pdfplumber")
+            library = 'pdfplumber'
+        self.backend = _PyMuPDFBackend() if library == 'pymupdf' else _PdfplumberBackend()
+        
+        workers = config.get_value('extraction.parallel_workers', 0)
+        self.page_workers = workers if workers > 0 else (os.cpu_count() or 1)
     
     def load_pdf(self, pdf_path: str):
         """
@@ -30,10 +263,10 @@ class PDFExtractor:
             pdf_path: Path to PDF file
             
         Returns:
-            pdfplumber PDF object
+            PDF document object of the active backend
         """
         try:
-            return pdfplumber.open(pdf_path)
+            return self.backend.open(pdf_path)
         except Exception as e:
             self.logger.error(f"Failed to load PDF: {e}")
             raise
@@ -51,42 +284,54 @@ class PDFExtractor:
         self.logger.info(f"Extracting text from: {pdf_path}")
         
         pdf = self.load_pdf(pdf_path)
+        pages = self.backend.pages(pdf)
         
         document_structure = {
             'metadata': {
                 'title': 'Unknown',
                 'author': 'Unknown',
-                'total_pages': len(pdf.pages)
+                'total_pages': len(pages)
             },
-            'pages': [],
             'sections': []
         }
         
         # First pass: analyze font sizes to determine heading threshold
         self.logger.info("Analyzing font sizes to detect headings...")
-        font_sizes = self._analyze_font_sizes(pdf)
-        self.logger.debug(f"Detected font size distribution: {font_sizes}")
+        font_sizes = self._analyze_font_sizes(pages)
+        self.logger.debug("Detected font size distribution: %s", font_sizes)
+        heading_threshold = font_sizes.get('heading_threshold', 12)
         
-        sections = []
-        current_section = {'title': 'Introduction', 'paragraphs': [], 'page_numbers': []}
-        section_id = 1
+        # Pages stream out of extraction (possibly from worker processes) straight
+        # into sectioning, so sections are built while later pages are extracted
+        page_paragraphs = self._extract_all_paragraphs(pdf_path, pages)
+        sections = list(self._stream_sections(page_paragraphs, heading_threshold))
         
-        for page_num, page in enumerate(pdf.pages, 1):
-            page_data = {
-                'page_number': page_num,
-                'elements': []
-            }
-            
-            # Extract text with character-level attributes
-            text_content = page.extract_text()
+        document_structure['sections'] = sections
+        self.backend.close(pdf)
+        
+        self.logger.info(f"Extracted {len(sections)} sections from {len(pages)} pages")
+        
+        return document_structure
+    
+    def _stream_sections(self, page_paragraphs: Iterable[List[Dict[str, Any]]],
+                         heading_threshold: float) -> Iterator[Dict[str, Any]]:
+        """
+        Split the document into sections in one forward pass over its pages
+        
+        Each section is yielded as soon as the next heading closes it.
+        
+        Args:
+            page_paragraphs: Paragraph lists, one per page, in page order
+            heading_threshold: Font size above which text is a heading
             
-            if text_content:
-                # Analyze text with character attributes to find headings
-                text_elements = self._extract_text_with_properties(page)
-                
-                # Group text elements into paragraphs
-                paragraphs = self._group_into_paragraphs(text_elements)
-                
+        Yields:
+            Section dictionaries
+        """
+        current_section = {'title': 'Introduction', 'paragraphs': [], 'page_numbers': set()}
+        section_id = 1
+        
+        for page_num, paragraphs in enumerate(page_paragraphs, 1):
+            if paragraphs:
                 for para in paragraphs:
                     if not para['lines']:
                         continue
@@ -95,19 +340,19 @@ class PDFExtractor:
                     first_line_props = para['lines'][0].get('properties', {})
                     
                     # Check if first line is a heading based on font properties
-                    is_heading = self._is_heading_font_based(first_line_text, first_line_props, font_sizes)
+                    is_heading = self._is_heading_font_based(first_line_text, first_line_props, heading_threshold)
                     
                     if is_heading and len(para['lines']) > 1:
                         # Extract just the heading text (may have extra words from body text)
                         # Split the first line where font changes from heading to body
-                        heading_text = self._extract_heading_text(para['lines'][0], font_sizes)
+                        heading_text = self._extract_heading_text(para['lines'][0], heading_threshold)
                         
                         # This paragraph starts with a heading
                         # Save current section if it has content
                         if current_section['paragraphs']:
-                            current_section['page_numbers'] = list(set(current_section['page_numbers']))
+                            current_section['page_numbers'] = sorted(current_section['page_numbers'])
                             current_section['section_id'] = f'section_{section_id}'
-                            sections.append(current_section.copy())
+                            yield current_section
                             section_id += 1
                         
                         # Start new section with the heading as title
@@ -115,75 +360,128 @@ class PDFExtractor:
                             'section_id': f'section_{section_id}',
                             'title': heading_text,
                             'paragraphs': [],
-                            'page_numbers': []
+                            'page_numbers': set()
                         }
                         
                         # Add remaining lines as paragraphs
                         for remaining_line in para['lines'][1:]:
                             if remaining_line['text'] and len(remaining_line['text']) > 20:
                                 current_section['paragraphs'].append(remaining_line['text'])
-                                current_section['page_numbers'].append(page_num)
+                                current_section['page_numbers'].add(page_num)
                     else:
                         # This is a regular paragraph - add to current section
-                        full_para_text = '\n'.join(line['text'] for line in para['lines'])
+                        lines = para['lines']
+                        # Most paragraphs are a single line; skip the join for those
+                        full_para_text = lines[0]['text'] if len(lines) == 1 else '\n'.join(line['text'] for line in lines)
                         if full_para_text and len(full_para_text) > 30:
                             current_section['paragraphs'].append(full_para_text)
-                            current_section['page_numbers'].append(page_num)
-            
-            document_structure['pages'].append(page_data)
+                            current_section['page_numbers'].add(page_num)
         
         # Add final section
         if current_section['paragraphs']:
-            current_section['page_numbers'] = list(set(current_section['page_numbers']))
-            sections.append(current_section)
+            current_section['page_numbers'] = sorted(current_section['page_numbers'])
+            yield current_section
+    
+    def _extract_all_paragraphs(self, pdf_path: str, pages: list) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Extract paragraphs for every page, across worker processes for long documents
         
-        document_structure['sections'] = sections
-        pdf.close()
+        Args:
+            pdf_path: Path to PDF file (workers open their own handle)
+            pages: Page objects of the active backend
+            
+        Yields:
+            Paragraph lists, one per page, in page order
+        """
+        num_pages = len(pages)
+        if self.page_workers <= 1 or num_pages < PARALLEL_MIN_PAGES:
+            for page in pages:
+                yield self._extract_page_paragraphs(page)
+            return
+        
+        # Contiguous page runs, a few per worker, so each worker opens the PDF
+        # once per run while load stays balanced
+        chunk_size = max(1, num_pages // (4 * self.page_workers))
+        chunks = [range(start, min(start + chunk_size, num_pages)) for start in range(0, num_pages, chunk_size)]
+        
+        self.logger.info(f"Extracting {num_pages} pages with {self.page_workers} worker processes")
+        done = 0
+        try:
+            # Spawned, not forked: this runs on an executor thread of the
+            # pipeline's event loop, and forking a multi-threaded process can
+            # copy locks held by other threads into the workers
+            with ProcessPoolExecutor(max_workers=self.page_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                # map() yields chunks in order as they finish
+                for chunk in pool.map(_extract_page_chunk, repeat(pdf_path), repeat(self.backend.name), chunks):
+                    for paragraphs in chunk:
+                        yield paragraphs
+                        done += 1
+        except Exception as e:
+            self.logger.warning(f"Parallel page extraction failed, extracting remaining pages serially: {e}")
+            for page in pages[done:]:
+                yield self._extract_page_paragraphs(page)
+    
+    def _extract_page_paragraphs(self, page) -> List[Dict[str, Any]]:
+        """
+        Extract the paragraphs of a single page
+        
+        Args:
+            page: Page object of the active backend
+            
+        Returns:
+            List of paragraph dictionaries (empty if the page has no text)
+        """
+        # Read the page's words once; an empty list doubles as the text-presence
+        # check that used to need a separate extract_text() pass
+        words = self.backend.page_words(page)
+        if not words:
+            return []
         
-        self.logger.info(f"Extracted {len(sections)} sections from {len(pdf.pages)} pages")
+        # Analyze text with character attributes to find headings
+        text_elements = self._extract_text_with_properties(words)
         
-        return document_structure
+        # Group text elements into paragraphs
+        return self._group_into_paragraphs(text_elements)
     
-    def _analyze_font_sizes(self, pdf) -> Dict[str, Any]:
+    def _analyze_font_sizes(self, pages: list) -> Dict[str, Any]:
         """
         Analyze font sizes across all pages to determine heading threshold
         
+        Characters are stride-sampled (about FONT_SAMPLE_CHARS per page). The
+        threshold comes from the modal body-text size, which sampling doesn't
+        shift; min/max/median are approximate.
+        
         Args:
-            pdf: pdfplumber PDF object
+            pages: Page objects of the active backend
             
         Returns:
             Dictionary with font size statistics
         """
-        from collections import Counter
-        
-        font_size_counts = Counter()
-        font_info = {'min': float('inf'), 'max': 0, 'sizes': []}
+        font_info = {'min': float('inf'), 'max': 0, 'count': 0}
         
         # Sample first few pages for efficiency
-        sample_pages = min(5, len(pdf.pages))
-        
-        for page in pdf.pages[:sample_pages]:
-            chars = page.chars
-            if chars:
-                for char in chars:
-                    size = char.get('size', 0)
-                    if size > 0:
-                        font_size_counts[size] += 1
-                        font_info['sizes'].append(size)
-                        font_info['min'] = min(font_info['min'], size)
-                        font_info['max'] = max(font_info['max'], size)
-        
-        # Calculate median and mode
-        if font_info['sizes']:
-            sorted_sizes = sorted(font_info['sizes'])
-            median_idx = len(sorted_sizes) // 2
-            font_info['median'] = sorted_sizes[median_idx]
-        
-        # Most common font size is likely body text
-        if font_size_counts:
-            most_common_size, most_common_count = font_size_counts.most_common(1)[0]
+        sample_pages = min(5, len(pages))
+        
+        sizes = np.concatenate(
+            [self.backend.char_sizes(page, FONT_SAMPLE_CHARS) for page in pages[:sample_pages]] or [np.empty(0, dtype=np.float32)]
+        )
+        sizes = sizes[sizes > 0]
+        
+        if sizes.size:
+            font_info['count'] = int(sizes.size)
+            font_info['min'] = float(sizes.min())
+            font_info['max'] = float(sizes.max())
+            
+            # Calculate median and mode
+            font_info['median'] = float(np.median(sizes))
+            
+            # Most common font size is likely body text
+            values, counts = np.unique(sizes.round(2), return_counts=True)
+            mode_idx = counts.argmax()
+            most_common_size = float(values[mode_idx])
             font_info['mode'] = most_common_size
-            font_info['mode_count'] = most_common_count
+            font_info['mode_count'] = int(counts[mode_idx])
             
             # Heading threshold: larger than 120% of most common size
             font_info['heading_threshold'] = most_common_size * 1.2
@@ -192,53 +490,39 @@ class PDFExtractor:
         
         return font_info
     
-    def _extract_text_with_properties(self, page) -> List[Dict[str, Any]]:
+    def _extract_text_with_properties(self, words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Extract text with font properties from page
+        Extract text with font properties from a page's words
         
         Args:
-            page: pdfplumber page object
+            words: Word dictionaries from the backend (read once per page)
             
         Returns:
             List of text elements with properties
         """
-        # Use pdfplumber's words which preserves spacing
-        words = page.extract_words()
+        if not words:
+            return []
         
-        # Group words into lines based on vertical position
-        lines = []
-        current_line = {'text': '', 'words': [], 'bottom': None, 'properties': {}}
+        # Group words into lines based on vertical position: a new line starts
+        # wherever the bottom coordinate jumps by more than 3 points
+        bottoms = np.fromiter((word.get('bottom', 0) for word in words), dtype=np.float32, count=len(words))
+        breaks = np.flatnonzero(np.abs(np.diff(bottoms)) > 3) + 1
+        bounds = [0, *breaks.tolist(), len(words)]
         
-        for word in words:
-            word_text = word.get('text', '')
-            word_bottom = word.get('bottom', 0)
-            
-            # New line if vertical position changes significantly (3 points)
-            if current_line['bottom'] is not None and abs(word_bottom - current_line['bottom']) > 3:
-                if current_line['words']:
-                    lines.append(current_line)
-                current_line = {'text': '', 'words': [], 'bottom': word_bottom, 'properties': {}}
-            
-            # Update bottom position for line
-            if current_line['bottom'] is None:
-                current_line['bottom'] = word_bottom
-            
-            # Add word to current line with space
-            if current_line['text']:
-                current_line['text'] += ' '  # Add space between words
-            current_line['text'] += word_text
-            current_line['words'].append(word)
-            
-            # Use first word's properties for the line
-            if not current_line['properties']:
-                # Try to get font info from word coordinates if available
-                current_line['properties'] = {
-                    'size': word.get('size', 0),
-                    'fontname': word.get('fontname', '')
+        lines = []
+        for start, end in zip(bounds, bounds[1:]):
+            line_words = words[start:end]
+            first_word = line_words[0]
+            lines.append({
+                'text': ' '.join(word.get('text', '') for word in line_words),
+                'words': line_words,
+                'bottom': first_word.get('bottom', 0),
+                # Use first word's properties for the line
+                'properties': {
+                    'size': first_word.get('size', 0),
+                    'fontname': first_word.get('fontname', '')
                 }
-        
-        if current_line['words']:
-            lines.append(current_line)
+            })
         
         return lines
     
@@ -266,6 +550,7 @@ class PDFExtractor:
             else:
                 current_para['lines'].append({
                     'text': text,
+                    'words': element.get('words', []),
                     'properties': element.get('properties', {})
                 })
         
@@ -274,13 +559,13 @@ class PDFExtractor:
         
         return paragraphs
     
-    def _extract_heading_text(self, line_data: Dict[str, Any], font_sizes: Dict[str, Any]) -> str:
+    def _extract_heading_text(self, line_data: Dict[str, Any], heading_threshold: float) -> str:
         """
         Extract just the heading text from a line that might contain mixed font sizes
         
         Args:
             line_data: Line dictionary with words and properties
-            font_sizes: Font size analysis
+            heading_threshold: Font size above which text is a heading
             
         Returns:
             Heading text without trailing body text
@@ -292,7 +577,6 @@ class PDFExtractor:
             return full_text.strip()
         
         # Find where heading font ends and body text begins
-        heading_threshold = font_sizes.get('heading_threshold', 12)
         heading_words = []
         
         for word in words:
@@ -308,56 +592,39 @@ class PDFExtractor:
         
         # If we found heading words, return them
         if heading_words:
-            heading_text = ''.join(heading_words).strip()
+            heading_text = (heading_words[0] if len(heading_words) == 1 else ' '.join(heading_words)).strip()
             # Clean up the text
             return heading_text
         
         # Fallback: return full text
         return full_text.strip()
     
-    def _is_heading_font_based(self, text: str, properties: Dict[str, Any], font_sizes: Dict[str, Any]) -> bool:
+    def _is_heading_font_based(self, text: str, properties: Dict[str, Any], heading_threshold: float) -> bool:
         """
         Detect headings based on font properties
         
         Args:
             text: Text to check
             properties: Font properties of the text
-            font_sizes: Font size analysis
+            heading_threshold: Font size above which text is a heading
             
         Returns:
             True if likely a heading
         """
-        if not text or len(text) < 3:
-            return False
-        
         font_size = properties.get('size', 0)
         fontname = properties.get('fontname', '')
         
-        # Check if font size is significantly larger than body text
-        if font_size > font_sizes.get('heading_threshold', 12):
-            self.logger.debug(f"Detected heading by font size: '{text[:50]}' (size: {font_size:.1f})")
-            return True
-        
-        # Check if font name suggests bold or heading
-        fontname_lower = fontname.lower()
-        if any(indicator in fontname_lower for indicator in ['bold', 'black', 'heavy', 'extrabold']):
-            self.logger.debug(f"Detected heading by font weight: '{text[:50]}' (font: {fontname})")
-            return True
-        
-        # Fallback to heuristics if font info is not available
-        if font_size == 0:
-            return self._is_heading(text)  # Use old heuristic as fallback
+        # Compare the raw sizes here; only the outcome goes into the cache key
+        result = _classify_heading(
+            text, font_size > heading_threshold, fontname, font_size != 0
+        )
         
-        # Check if text is short and title case
-        if len(text) < 150:
-            if text.istitle() and len(text) < 100:
-                return True
-            
-            # Check for all caps (common in headings)
-            if text.isupper() and len(text) < 80:
-                return True
+        if result == _HEADING_BY_SIZE:
+            self.logger.debug("Detected heading by font size: '%.50s' (size: %.1f)", text, font_size)
+        elif result == _HEADING_BY_WEIGHT:
+            self.logger.debug("Detected heading by font weight: '%.50s' (font: %s)", text, fontname)
         
-        return False
+        return result != _NOT_HEADING
     
     def _is_heading(self, text: str) -> bool:
         """
@@ -370,42 +637,4 @@ class PDFExtractor:
         Returns:
             True if likely a heading
         """
-        if not text or len(text) < 3:
-            return False
-        
-        text_len = len(text)
-        words = text.split()
-        
-        # Very short text (likely heading)
-        if text_len < 20 and len(words) < 5:
-            return True
-        
-        # Short text in title case (common heading pattern)
-        if text.istitle() and text_len < 100 and len(words) < 10:
-            return True
-        
-        # All caps text that's not too long (common in headings)
-        if text.isupper() and text_len < 80 and len(words) < 12:
-            return True
-        
-        # Text with multiple capitalized words (heading pattern)
-        if len(words) < 8 and text_len < 80:
-            capitalized_count = sum(1 for w in words if w and w[0].isupper())
-            # If most words are capitalized
-            if capitalized_count >= len(words) * 0.7:
-                return True
-        
-        # Short lines ending with colon (common heading pattern)
-        if text.endswith(':') and text_len < 100:
-            return True
-        
-        # Very short text relative to typical paragraph length
-        if text_len < 150 and len(words) < 15:
-            # Additional check: no sentence-ending punctuation in middle
-            # (headings rarely have periods, question marks, etc. in the middle)
-            mid_text = text[10:-10] if text_len > 20 else text
-            if not any(punct in mid_text for punct in ['.', '!', '?', ',']):
-                return True
-            
-        return False
-
+        return _is_heading_text(text)
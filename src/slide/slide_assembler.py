@@ -2,12 +2,15 @@
 Slide Assembler
 Creates PowerPoint presentations from slide content
 """
-from typing import List, Dict, Any
+import gc
+from bisect import bisect_left
+from typing import List, Dict, Any, Iterable
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_ANCHOR
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 import os
@@ -16,6 +19,35 @@ import os
 class SlideAssembler:
     """Assembles PowerPoint presentations"""
     
+    # Layout constants - lengths and colors are immutable, so build them once
+    _BACKGROUND_COLOR = RGBColor(0xE8, 0xF4, 0xF8)  # Light blue
+    _TITLE_COLOR = RGBColor(0x4A, 0x90, 0xE2)  # Blue color
+    _BULLET_COLOR = RGBColor(0x22, 0x22, 0x22)  # Dark gray
+    
+    _LEFT_MARGIN = Inches(0.5)
+    _TITLE_Y = Inches(0.3)
+    _TITLE_WIDTH = Inches(9)
+    _TITLE_HEIGHT = Inches(1.2)
+    _CONTENT_Y = Inches(1.5)
+    _CONTENT_HEIGHT = Inches(3.8)
+    _FULL_WIDTH = Inches(9)
+    _COLUMN_WIDTH = Inches(4.5)
+    _IMAGE_X = Inches(5.5)
+    _IMAGE_WIDTH = Inches(4)
+    _TEXT_MARGIN_X = Inches(0.1)
+    _TEXT_MARGIN_Y = Inches(0.05)
+    
+    # Font size lookup: index = number of length (or word count) thresholds exceeded
+    _TITLE_FONT_SIZES = (Pt(32), Pt(28), Pt(24))  # Short, medium, long titles
+    _TITLE_LENGTH_BINS = (40, 60)
+    _TITLE_WORD_BINS = (6, 8)
+    _BULLET_FONT_SIZES = (Pt(14), Pt(13), Pt(12), Pt(11))  # Short to very long bullets
+    _BULLET_LENGTH_BINS = (100, 150, 200)
+    _BULLET_WORD_BINS = (12, 15, 20)
+    _NO_SPACE = Pt(0)
+    _TITLE_SPACE_AFTER = Pt(12)
+    _BULLET_SPACE_AFTER = Pt(10)
+    
     def __init__(self, config: ConfigManager, logger: Logger):
         """
         Initialize slide assembler
@@ -30,15 +62,18 @@ class SlideAssembler:
         self.aspect_ratio = config.get_value('slides.aspect_ratio', '16:9')
         self.theme = config.get_value('slides.theme', 'modern')
     
-    def create_presentation(self, slides: List[Dict[str, Any]], output_path: str) -> None:
+    def create_presentation(self, slides: Iterable[Dict[str, Any]], output_path: str) -> None:
         """
         Create PowerPoint presentation from slides
         
+        Slides are consumed one at a time, so a generator can feed them as
+        they are produced without the whole deck being held in memory.
+        
         Args:
-            slides: List of enriched SlideContent dictionaries
+            slides: Iterable of enriched SlideContent dictionaries
             output_path: Output file path
         """
-        self.logger.info(f"Creating presentation with {len(slides)} slides...")
+        self.logger.info("Creating presentation...")
         
         # Create presentation
         prs = Presentation()
@@ -52,14 +87,18 @@ class SlideAssembler:
             prs.slide_height = Inches(7.5)
         
         # Add slides
+        slide_count = 0
         for slide_data in slides:
             self._add_slide(prs, slide_data)
+            slide_count += 1
+            if slide_count % 10 == 0:
+                gc.collect()
         
         # Save presentation
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         prs.save(output_path)
         
-        self.logger.info(f"Presentation saved to: {output_path}")
+        self.logger.info(f"Presentation with {slide_count} slides saved to: {output_path}")
     
     def _add_slide(self, prs: Presentation, slide_data: Dict[str, Any]) -> None:
         """
@@ -77,10 +116,10 @@ class SlideAssembler:
         background = slide.background
         fill = background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor(0xE8, 0xF4, 0xF8)  # Light blue
+        fill.fore_color.rgb = self._BACKGROUND_COLOR
         
         # Add title with proper sizing and word wrapping
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(1.2))
+        title_box = slide.shapes.add_textbox(self._LEFT_MARGIN, self._TITLE_Y, self._TITLE_WIDTH, self._TITLE_HEIGHT)
         title_frame = title_box.text_frame
         title_frame.word_wrap = True
         title_frame.vertical_anchor = MSO_ANCHOR.TOP
@@ -96,55 +135,57 @@ class SlideAssembler:
         title_length = len(title_text)
         word_count = len(title_text.split())
         
-        if title_length > 60 or word_count > 8:
-            # Long titles: smaller font
-            title_font_size = Pt(24)
-        elif title_length > 40 or word_count > 6:
-            # Medium titles
-            title_font_size = Pt(28)
-        else:
-            # Short titles: larger font
-            title_font_size = Pt(32)
+        # Longer titles get smaller fonts
+        title_font_size = self._TITLE_FONT_SIZES[max(
+            bisect_left(self._TITLE_LENGTH_BINS, title_length),
+            bisect_left(self._TITLE_WORD_BINS, word_count)
+        )]
         
         title_para.font.size = title_font_size
         title_para.font.bold = True
-        title_para.font.color.rgb = RGBColor(0x4A, 0x90, 0xE2)  # Blue color
+        title_para.font.color.rgb = self._TITLE_COLOR
         title_para.alignment = PP_ALIGN.LEFT
-        title_para.space_before = Pt(0)
-        title_para.space_after = Pt(12)
+        title_para.space_before = self._NO_SPACE
+        title_para.space_after = self._TITLE_SPACE_AFTER
         
         # Enable auto-fit to prevent text overflow
         title_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
         
         # Check if there's an image to determine layout
-        has_image = 'visual' in slide_data and 'path' in slide_data['visual'] and os.path.exists(slide_data['visual']['path'])
+        # (VisualGenerator records whether the file exists; stat only if it didn't)
+        visual = slide_data.get('visual', {})
+        if 'exists' in visual:
+            has_image = visual['exists']
+        else:
+            has_image = 'path' in visual and os.path.exists(visual['path'])
         
         # Add bullets with proper formatting (positioned below title)
         # Adjust width based on whether there's an image
         if has_image:
             # Two-column layout: content on left, image on right
-            bullet_box_width = Inches(4.5)
-            image_x = Inches(5.5)
-            left_margin = Inches(0.5)
+            bullet_box_width = self._COLUMN_WIDTH
+            image_x = self._IMAGE_X
+            left_margin = self._LEFT_MARGIN
         else:
             # Full-width layout: content spans entire width
-            bullet_box_width = Inches(9)
-            left_margin = Inches(0.5)
+            bullet_box_width = self._FULL_WIDTH
+            left_margin = self._LEFT_MARGIN
         
         # Position content box below title (start at 1.5 inches from top)
-        bullet_box = slide.shapes.add_textbox(left_margin, Inches(1.5), bullet_box_width, Inches(3.8))
+        bullet_box = slide.shapes.add_textbox(left_margin, self._CONTENT_Y, bullet_box_width, self._CONTENT_HEIGHT)
         bullet_frame = bullet_box.text_frame
         bullet_frame.word_wrap = True
-        bullet_frame.margin_left = Inches(0.1)   # Internal left margin
-        bullet_frame.margin_right = Inches(0.1)  # Internal right margin
-        bullet_frame.margin_top = Inches(0.05)   # Internal top margin
-        bullet_frame.margin_bottom = Inches(0.05)  # Internal bottom margin
+        bullet_frame.margin_left = self._TEXT_MARGIN_X   # Internal left margin
+        bullet_frame.margin_right = self._TEXT_MARGIN_X  # Internal right margin
+        bullet_frame.margin_top = self._TEXT_MARGIN_Y   # Internal top margin
+        bullet_frame.margin_bottom = self._TEXT_MARGIN_Y  # Internal bottom margin
         
         bullets = slide_data.get('bullets', [])
         
-        # Clear existing paragraphs
-        while len(bullet_frame.paragraphs) > 0:
-            bullet_frame._element.remove(bullet_frame.paragraphs[0]._element)
+        # Clear existing paragraphs in one pass over the txBody children
+        tx_body = bullet_frame._element
+        for p in tx_body.findall(qn('a:p')):
+            tx_body.remove(p)
         
         # Add bullets as separate paragraphs with proper spacing
         for i, bullet_text in enumerate(bullets):
@@ -161,8 +202,8 @@ class SlideAssembler:
             # Format the paragraph first
             para.alignment = PP_ALIGN.LEFT
             para.level = 0
-            para.space_before = Pt(0)
-            para.space_after = Pt(10)  # Space between bullets
+            para.space_before = self._NO_SPACE
+            para.space_after = self._BULLET_SPACE_AFTER  # Space between bullets
             
             # Use simple bullet point formatting (no complex indents)
             para.text = f"• {clean_bullet}"
@@ -172,18 +213,14 @@ class SlideAssembler:
             word_count = len(clean_bullet.split())
             
             # Determine font size based on content length
-            if bullet_length > 200 or word_count > 20:
-                bullet_font_size = Pt(11)  # Very long bullets
-            elif bullet_length > 150 or word_count > 15:
-                bullet_font_size = Pt(12)  # Long bullets
-            elif bullet_length > 100 or word_count > 12:
-                bullet_font_size = Pt(13)  # Medium bullets
-            else:
-                bullet_font_size = Pt(14)  # Short bullets
+            bullet_font_size = self._BULLET_FONT_SIZES[max(
+                bisect_left(self._BULLET_LENGTH_BINS, bullet_length),
+                bisect_left(self._BULLET_WORD_BINS, word_count)
+            )]
             
             # Format the entire paragraph
             para.font.size = bullet_font_size
-            para.font.color.rgb = RGBColor(0x22, 0x22, 0x22)  # Dark gray
+            para.font.color.rgb = self._BULLET_COLOR
             para.font.name = 'Calibri'
             
             # Use simple indentation - just set level for bullets
@@ -196,9 +233,14 @@ class SlideAssembler:
                 # Add image to right side, aligned with content
                 slide.shapes.add_picture(
                     img_path,
-                    image_x, Inches(1.5),  # Match content Y position
-                    width=Inches(4), height=Inches(3.8)  # Match content height
+                    image_x, self._CONTENT_Y,  # Match content Y position
+                    width=self._IMAGE_WIDTH, height=self._CONTENT_HEIGHT  # Match content height
                 )
             except Exception as e:
                 self.logger.warning(f"Could not add image {img_path}: {e}")
+        
+        # Speaker notes go in the notes page, where the video narration reads them
+        speaker_notes = slide_data.get('speaker_notes', '')
+        if speaker_notes:
+            slide.notes_slide.notes_text_frame.text = speaker_notes
 
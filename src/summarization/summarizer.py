@@ -2,7 +2,8 @@
 Summarizer
 Summarizes content into slide-appropriate text
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import numpy as np
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 from utils.text_processor import TextProcessor
@@ -44,11 +45,14 @@ class Summarizer:
         # Generate title
         slide_title = self.generate_title(title, text)
         
+        # Split once for both bullets and speaker notes
+        sentences = self.text_processor.split_into_sentences(text)
+        
         # Generate bullet points
-        bullets = self.generate_bullet_points(text)
+        bullets = self.generate_bullet_points(text, sentences=sentences)
         
         # Generate speaker notes
-        speaker_notes = self.generate_speaker_notes(text)
+        speaker_notes = self.generate_speaker_notes(text, sentences=sentences)
         
         return {
             'slide_number': len(section.get('page_numbers', [])),
@@ -81,13 +85,15 @@ class Summarizer:
         # Otherwise, truncate or summarize
         return self.text_processor.truncate_words(section_title, max_words)
     
-    def generate_bullet_points(self, text: str, count: int = None) -> list:
+    def generate_bullet_points(self, text: str, count: int = None,
+                               sentences: Optional[List[str]] = None) -> list:
         """
         Generate bullet points from text
         
         Args:
             text: Input text
             count: Number of bullets (optional)
+            sentences: `text` already split into sentences (optional)
             
         Returns:
             List of bullet point strings
@@ -99,7 +105,8 @@ class Summarizer:
             return ["Key information", "Main points"] * ((count + 1) // 2)
         
         # Split into sentences
-        sentences = self.text_processor.split_into_sentences(text)
+        if sentences is None:
+            sentences = self.text_processor.split_into_sentences(text)
         
         if not sentences:
             # Fallback: Split by clauses or periods
@@ -110,70 +117,85 @@ class Summarizer:
         
         # Select the best sentences - prioritize medium length sentences
         # (not too short, not too long)
-        scored_sentences = []
-        for sent in sentences:
-            sent_len = len(sent.split())
-            # Prefer sentences with 10-25 words
-            if 10 <= sent_len <= 25:
-                score = 1.0
-            elif 5 <= sent_len < 10:
-                score = 0.7
-            elif 25 < sent_len <= 40:
-                score = 0.8
-            else:
-                score = 0.5
-            
-            scored_sentences.append((score, sent))
+        selected = self._select_sentences(sentences, count)
         
-        # Sort by score and select top N
-        scored_sentences.sort(key=lambda x: x[0], reverse=True)
-        selected = [sent for _, sent in scored_sentences[:count]]
+        # Local aliases for the per-sentence loops
+        tp = self.text_processor
+        normalize = tp.normalize_text
+        truncate = tp.truncate_words
+        max_words = self.max_bullet_words
         
         # Clean and truncate each sentence for bullets
         bullets = []
         for sent in selected:
-            cleaned = self.text_processor.normalize_text(sent)
             # Truncate to appropriate length
-            truncated = self.text_processor.truncate_words(cleaned, self.max_bullet_words)
-            # Filter out short or meaningless text
-            if truncated.strip() and len(truncated.strip()) > 15:
-                # Skip if it's just fragments or gibberish
-                words = truncated.strip().split()
-                if len(words) >= 3:  # At least 3 words to be meaningful
-                    bullets.append(truncated)
+            truncated = truncate(normalize(sent), max_words)
+            stripped = truncated.strip()
+            # Filter out short or meaningless text; skip if it's just
+            # fragments or gibberish (at least 3 words to be meaningful)
+            if len(stripped) > 15 and len(stripped.split()) >= 3:
+                bullets.append(truncated)
         
         # If we don't have enough bullets, add more
         if len(bullets) < count and sentences:
             remaining = sentences[len(bullets):]
             for sent in remaining[:count - len(bullets)]:
-                cleaned = self.text_processor.normalize_text(sent)
-                truncated = self.text_processor.truncate_words(cleaned, self.max_bullet_words)
-                # Filter out short or meaningless text
-                if truncated.strip() and truncated not in bullets:
-                    words = truncated.strip().split()
-                    if len(words) >= 3:  # At least 3 words
-                        bullets.append(truncated)
+                truncated = truncate(normalize(sent), max_words)
+                # Filter out short or meaningless text (at least 3 words)
+                if truncated not in bullets and len(truncated.split()) >= 3:
+                    bullets.append(truncated)
         
         # Ensure we have at least count bullets
-        while len(bullets) < count:
-            # Extract key phrases as bullets
-            key_phrases = self.text_processor.extract_keywords(text, n=3)
-            if key_phrases:
-                bullets.append(f"Key concepts: {', '.join(key_phrases[:3])}")
-            else:
-                bullets.append("Important points covered")
-            if len(bullets) >= count:
-                break
+        if len(bullets) < count:
+            # Extract key phrases as bullets - same text, so one extraction
+            key_phrases = tp.extract_keywords(text, n=3)
+            filler = f"Key concepts: {', '.join(key_phrases[:3])}" if key_phrases else "Important points covered"
+            bullets.extend([filler] * (count - len(bullets)))
         
         return bullets[:count]
     
-    def generate_speaker_notes(self, text: str, max_words: int = None) -> str:
+    @staticmethod
+    def _select_sentences(sentences: list, count: int) -> list:
+        """
+        Pick the top `count` sentences by length score, keeping document order on ties
+        
+        Args:
+            sentences: Candidate sentences
+            count: Number of sentences to select
+            
+        Returns:
+            Selected sentences, best first
+        """
+        n = len(sentences)
+        if n == 0 or count <= 0:
+            return []
+        
+        lens = np.fromiter((len(s.split()) for s in sentences), dtype=np.int32, count=n)
+        # Rank 0 is best: 10-25 words (1.0), 26-40 (0.8), 5-9 (0.7), anything else (0.5)
+        rank = np.select(
+            [(lens >= 10) & (lens <= 25), (lens > 25) & (lens <= 40), (lens >= 5) & (lens < 10)],
+            [0, 1, 2],
+            default=3
+        )
+        # Unique keys that order by rank, then position - same result as a stable sort
+        keys = rank * n + np.arange(n)
+        if count < n:
+            top = np.argpartition(keys, count - 1)[:count]
+            top = top[np.argsort(keys[top])]
+        else:
+            top = np.argsort(keys)
+        
+        return [sentences[i] for i in top]
+    
+    def generate_speaker_notes(self, text: str, max_words: int = None,
+                               sentences: Optional[List[str]] = None) -> str:
         """
         Generate speaker notes from text
         
         Args:
             text: Input text
             max_words: Maximum words (optional)
+            sentences: `text` already split into sentences (optional)
             
         Returns:
             Speaker notes string
@@ -182,7 +204,8 @@ class Summarizer:
             max_words = self.max_speaker_words
         
         # Take first sentence as speaker notes
-        sentences = self.text_processor.split_into_sentences(text)
+        if sentences is None:
+            sentences = self.text_processor.split_into_sentences(text)
         if sentences:
             notes = sentences[0]
         else:
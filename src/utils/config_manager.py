@@ -2,9 +2,28 @@
 Configuration Manager
 Handles loading and validation of configuration
 """
+import copy
 import yaml
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Iterator
+
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed config files keyed by (absolute path, mtime); managers get deep copies
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _flatten(tree: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield (dotted key, value) for every node, subtrees included"""
+    for k, v in tree.items():
+        path = f"{prefix}{k}"
+        yield path, v
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{path}.")
 
 
 class ConfigManager:
@@ -25,25 +44,56 @@ class ConfigManager:
             self.config_path = config_path
         
         self.config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._load_config()
     
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'ConfigManager':
+        """
+        Build a ConfigManager around an already-loaded configuration
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            ConfigManager instance (no file is read)
+        """
+        manager = cls.__new__(cls)
+        manager.config_path = None
+        manager.config = config
+        manager._rebuild_index()
+        return manager
+    
     def _load_config(self) -> None:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            cache_key = (os.path.abspath(self.config_path), os.stat(self.config_path).st_mtime_ns)
+            parsed = _YAML_CACHE.get(cache_key)
+            if parsed is None:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    # Plain dict (empty file -> {}) so the manager pickles cleanly to worker processes
+                    parsed = yaml.load(f, Loader=_SafeLoader) or {}
+                _YAML_CACHE[cache_key] = parsed
+            # Callers override values in place (CLI flags), so never hand out the cached dict
+            self.config = copy.deepcopy(parsed)
         except FileNotFoundError:
             print(f"Warning: Config file not found at {self.config_path}")
             self.config = self._get_default_config()
         except yaml.YAMLError as e:
             print(f"Error parsing config file: {e}")
             self.config = self._get_default_config()
+        
+        self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """Flatten the config tree into dotted keys so lookups are a single dict get"""
+        self._flat = dict(_flatten(self.config))
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration"""
         return {
             "input": {"validate_format": True},
-            "extraction": {"library": "pdfplumber"},
+            "extraction": {"library": "pymupdf"},
             "analysis": {"max_slides": 10, "min_slides": 6},
             "summarization": {"max_title_words": 20, "max_bullet_words": 15},
             "visuals": {"strategy": "simple_generation"},
@@ -61,18 +111,32 @@ class ConfigManager:
             default: Default value if key not found
             
         Returns:
-            Config value or default
+            Config value or default; sections and lists come back as copies,
+            so changing them never leaves the lookup index stale (use
+            set_value to change the config)
+        """
+        value = self._flat.get(key, default)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+    
+    def set_value(self, key: str, value: Any) -> None:
         """
-        keys = key.split('.')
-        value = self.config
+        Set config value by key path, creating intermediate sections as needed
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        Args:
+            key: Dot-separated key path (e.g., "video.fps")
+            value: Value to store
+        """
+        *parents, leaf = key.split('.')
+        node = self.config
+        for k in parents:
+            if not isinstance(node.get(k), dict):
+                node[k] = {}
+            node = node[k]
+        node[leaf] = value
         
-        return value
+        self._rebuild_index()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Alias for get_value"""
@@ -100,6 +164,6 @@ class ConfigManager:
         return True
     
     def get_config(self) -> Dict[str, Any]:
-        """Get full configuration dictionary"""
+        """Get full configuration dictionary (read-only - use set_value to change it)"""
         return self.config
 
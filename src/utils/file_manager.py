@@ -2,6 +2,8 @@
 File Manager
 Handles file operations and directory management
 """
+import glob
+import hashlib
 import os
 import shutil
 from pathlib import Path
@@ -37,13 +39,12 @@ class FileManager:
         Returns:
             True if valid, False otherwise
         """
-        if not os.path.exists(path):
+        # Cheap suffix check first - no syscall for non-PDF names
+        if path[-4:].lower() != '.pdf':
             return False
         
-        if not path.lower().endswith('.pdf'):
-            return False
-        
-        # Check if file is readable
+        # Opening covers the existence check too (missing paths and
+        # directories raise OSError)
         try:
             with open(path, 'rb') as f:
                 f.read(4)  # Try to read first bytes
@@ -67,6 +68,8 @@ class FileManager:
             raise FileNotFoundError(f"Source file not found: {source}")
         
         os.makedirs(os.path.dirname(dest), exist_ok=True)
+        # On Python 3.8+ (our minimum) copy2 already copies the body with
+        # os.sendfile on Linux and fcopyfile on macOS, so no manual fast path
         shutil.copy2(source, dest)
     
     @staticmethod
@@ -75,18 +78,50 @@ class FileManager:
         Clean up temporary files matching pattern
         
         Args:
-            pattern: File pattern to match (e.g., "*.tmp")
+            pattern: Glob pattern to match, "**" recurses (e.g., "temp/**/*.tmp")
+        """
+        # Stream matches so only the matching files are touched, not whole trees
+        for path in glob.iglob(pattern, recursive=True):
+            try:
+                os.unlink(path)
+            except IsADirectoryError:
+                continue
+            except OSError as e:
+                print(f"Warning: Could not remove {path}: {e}")
+    
+    @staticmethod
+    def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+        """
+        Compute the SHA-256 digest of a file's contents
+        
+        Args:
+            path: File path
+            chunk_size: Bytes read per iteration
+            
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def get_cache_directory(app_name: str = "vep") -> str:
         """
-        # This is a placeholder - actual implementation would use glob
-        # For now, we'll clean up common temp directories
-        temp_dirs = ["temp", "tmp"]
+        Get (and create) the per-user cache directory
         
-        for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir)
-                except Exception as e:
-                    print(f"Warning: Could not clean {temp_dir}: {e}")
+        Args:
+            app_name: Subdirectory name under the user cache root
+            
+        Returns:
+            Absolute path to cache directory
+        """
+        cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        cache_dir = os.path.join(cache_root, app_name)
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
     
     @staticmethod
     def get_file_size(path: str) -> int:
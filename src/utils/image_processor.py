@@ -3,9 +3,38 @@ Image Processor
 Handles image processing and generation
 """
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from typing import Tuple, Optional, List
 import os
 
+# Bitmap fallback font, loaded once per process
+_DEFAULT_FONT = ImageFont.load_default()
+
+
+@lru_cache(maxsize=32)
+def _get_font(size: int):
+    """Load Arial at the given size once; falls back to the default font"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return _DEFAULT_FONT
+
+
+# Shape colors for create_simple_diagram
+_DIAGRAM_COLORS = ('#4A90E2', '#50C878', '#F5A623', '#E74C3C', '#9B59B6')
+
+
+@lru_cache(maxsize=64)
+def _diagram_layout(count: int, size: Tuple[int, int]) -> Tuple[Tuple[tuple, tuple, str], ...]:
+    """Circle bboxes, label positions and colors for a diagram of `count` shapes"""
+    layout = []
+    for i in range(count):
+        # Draw different shapes based on position
+        x = 100 + (i * 150) % (size[0] - 200)
+        y = 100 + (i * 100) % (size[1] - 200)
+        layout.append(((x, y, x + 100, y + 100), (x + 45, y + 35), _DIAGRAM_COLORS[i % len(_DIAGRAM_COLORS)]))
+    return tuple(layout)
+
 
 class ImageProcessor:
     """Processes and manipulates images"""
@@ -24,7 +53,8 @@ class ImageProcessor:
         return image.resize(size, Image.Resampling.LANCZOS)
     
     def add_text_to_image(self, image: Image.Image, text: str, position: Tuple[int, int], 
-                          font_size: int = 20) -> Image.Image:
+                          font_size: int = 20,
+                          draw: Optional[ImageDraw.ImageDraw] = None) -> Image.Image:
         """
         Add text overlay to image at position
         
@@ -33,18 +63,14 @@ class ImageProcessor:
             text: Text to add
             position: Text position (x, y)
             font_size: Font size
+            draw: Existing ImageDraw for `image`, reused across chained overlays
             
         Returns:
             Image with text overlay
         """
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
-        
-        draw.text(position, text, fill="black", font=font)
+        if draw is None:
+            draw = ImageDraw.Draw(image)
+        draw.text(position, text, fill="black", font=_get_font(font_size))
         return image
     
     def create_simple_diagram(self, keywords: List[str], size: Tuple[int, int] = (800, 600)) -> Image.Image:
@@ -63,36 +89,36 @@ class ImageProcessor:
         draw = ImageDraw.Draw(img)
         
         # Draw simple geometric shapes based on keywords
-        colors = ['#4A90E2', '#50C878', '#F5A623', '#E74C3C', '#9B59B6']
+        keywords = keywords[:5]  # Max 5 shapes
+        layout = _diagram_layout(len(keywords), tuple(size))
         
-        for i, keyword in enumerate(keywords[:5]):  # Max 5 shapes
-            color = colors[i % len(colors)]
-            
-            # Draw different shapes based on position
-            x = 100 + (i * 150) % (size[0] - 200)
-            y = 100 + (i * 100) % (size[1] - 200)
-            
+        for keyword, (bbox, text_pos, color) in zip(keywords, layout):
             # Draw circle
-            bbox = (x, y, x + 100, y + 100)
             draw.ellipse(bbox, fill=color, outline='#FFFFFF', width=3)
             
             # Add simple text (first letter)
             if keyword:
-                draw.text((x + 45, y + 35), keyword[0].upper(), fill='white', font=ImageFont.load_default())
+                draw.text(text_pos, keyword[0].upper(), fill='white', font=_DEFAULT_FONT)
         
         return img
     
-    def convert_to_png(self, image: Image.Image, output_path: str) -> None:
+    def convert_to_png(self, image: Image.Image, output_path: str, compress_level: int = 1,
+                       make_dirs: bool = True) -> None:
         """
         Convert image to PNG and save
         
         Args:
             image: PIL Image object
             output_path: Output file path
+            compress_level: zlib level 0-9; flat-colour diagrams compress
+                nearly as well at 1 as at Pillow's default 6, for far less CPU
+            make_dirs: Create the parent directory first; callers that made
+                it up front can skip the check
         """
         # Create directory if needed
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        image.save(output_path, 'PNG')
+        if make_dirs:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        image.save(output_path, 'PNG', compress_level=compress_level, optimize=False)
     
     def create_placeholder_image(self, size: Tuple[int, int] = (800, 600), 
                                  color: str = "#E8F4F8", text: str = "") -> Image.Image:
@@ -111,9 +137,11 @@ class ImageProcessor:
         
         if text:
             draw = ImageDraw.Draw(img)
-            w, h = draw.textsize(text, ImageFont.load_default())
+            # textsize() was removed in Pillow 10
+            left, top, right, bottom = draw.textbbox((0, 0), text, font=_DEFAULT_FONT)
+            w, h = right - left, bottom - top
             position = ((size[0] - w) // 2, (size[1] - h) // 2)
-            draw.text(position, text, fill='#666666', font=ImageFont.load_default())
+            draw.text(position, text, fill='#666666', font=_DEFAULT_FONT)
         
         return img
 
@@ -9,36 +9,55 @@ from typing import Optional
 from pathlib import Path
 
 
+_LOGGER_NAME = 'visual_explanation'
+
+# Set once the shared logger has its level and console handler in this process
+_configured = False
+
+
+def _configure_once() -> logging.Logger:
+    """Return the application logger, setting it up on first use in this process"""
+    global _configured
+    logger = logging.getLogger(_LOGGER_NAME)
+    if not _configured:
+        _configured = True
+        logger.setLevel(logging.INFO)
+        
+        # Avoid duplicate handlers (e.g. inherited by a forked worker)
+        if not logger.handlers:
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            
+            # Formatter
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            console_handler.setFormatter(formatter)
+            
+            logger.addHandler(console_handler)
+    return logger
+
+
 class Logger:
     """Handles application logging"""
     
-    _instance: Optional['Logger'] = None
+    def __init__(self):
+        # logging.getLogger already returns one shared logger per name,
+        # so every Logger() wraps the same handlers and level
+        self.logger = _configure_once()
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-        return cls._instance
+    def __getstate__(self):
+        """Pickle without the logger - handlers (open streams/files) can't cross processes"""
+        state = self.__dict__.copy()
+        del state['logger']
+        return state
     
-    def __init__(self):
-        if not hasattr(self, 'initialized'):
-            self.initialized = True
-            self.logger = logging.getLogger('visual_explanation')
-            self.logger.setLevel(logging.INFO)
-            
-            # Avoid duplicate handlers
-            if not self.logger.handlers:
-                # Console handler
-                console_handler = logging.StreamHandler(sys.stdout)
-                console_handler.setLevel(logging.INFO)
-                
-                # Formatter
-                formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S'
-                )
-                console_handler.setFormatter(formatter)
-                
-                self.logger.addHandler(console_handler)
+    def __setstate__(self, state):
+        """Reattach to the shared logger in the receiving process"""
+        self.__dict__.update(state)
+        self.logger = _configure_once()
     
     def initialize_logging(self, log_file: Optional[str] = None) -> None:
         """
@@ -51,29 +70,33 @@ class Logger:
             # Create directory if needed
             Path(log_file).parent.mkdir(parents=True, exist_ok=True)
             
-            # File handler
-            file_handler = logging.FileHandler(log_file)
+            # File handler (opened on the first record, not up front)
+            file_handler = logging.FileHandler(log_file, delay=True)
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(
                 logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             )
             self.logger.addHandler(file_handler)
     
-    def info(self, message: str) -> None:
+    # Messages may use %-style placeholders with args, e.g.
+    # logger.debug("Parsed %d pages", n) - the string is only built when
+    # a handler will actually emit the record, unlike an f-string
+    
+    def info(self, message: str, *args) -> None:
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
     def log_stage_completion(self, stage: str, duration: float) -> None:
         """
@@ -83,5 +106,5 @@ class Logger:
             stage: Stage name
             duration: Duration in seconds
         """
-        self.info(f"Stage '{stage}' completed in {duration:.2f} seconds")
+        self.info("Stage '%s' completed in %.2f seconds", stage, duration)
 
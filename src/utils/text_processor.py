@@ -3,28 +3,92 @@ Text Processor
 Handles text processing and manipulation
 """
 import re
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from typing import List, FrozenSet, Optional, Tuple
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 
-# Download required NLTK data
+# Download required NLTK data, only when it isn't installed already
+for _package, _resource in (('punkt', 'tokenizers/punkt'), ('stopwords', 'corpora/stopwords')):
+    try:
+        nltk.data.find(_resource)
+    except LookupError:
+        try:
+            nltk.download(_package, quiet=True)
+        except:
+            pass
+
+# Compiled once at import
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_RE = re.compile(r'[^a-zA-Z0-9\s.,!?-]')
+# Runs of letters - the tokens word_tokenize + isalpha() kept, without the Treebank tokenizer
+_WORD_RE = re.compile(r'[^\W\d_]+')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Below this length a sentence-end regex split beats running Punkt
+SHORT_TEXT_CHARS = 200
+
+# Loaded once per process and shared by every TextProcessor instance
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+    _STOPWORDS: FrozenSet[str] = frozenset(stopwords.words('english'))
 except:
-    pass
+    _STOPWORDS = frozenset()
+
+
+@lru_cache(maxsize=1024)
+def _top_keywords(text: str, n: int, stop_words: FrozenSet[str]) -> Tuple[str, ...]:
+    """Cached keyword extraction - identical section texts are only tokenized once"""
+    # Tokenize and normalize
+    words = _WORD_RE.findall(text.lower())
+    
+    # Filter out stopwords
+    words = [w for w in words if w not in stop_words]
+    
+    # Count frequencies
+    word_freq = Counter(words)
+    
+    # Get top N
+    return tuple(word for word, _ in word_freq.most_common(n))
+
+
+@lru_cache(maxsize=1024)
+def _split_sentences(text: str) -> Tuple[str, ...]:
+    """Cached sentence split - bullets and speaker notes split the same section text"""
+    if len(text) < SHORT_TEXT_CHARS:
+        return tuple(s for s in _SENTENCE_END_RE.split(text.strip()) if s)
+    
+    try:
+        return tuple(sent_tokenize(text))
+    except:
+        # Fallback if NLTK fails
+        return tuple(s.strip() for s in text.split('.') if s.strip())
+
+
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Cached whitespace normalization"""
+    # Collapse whitespace runs - \s covers \n and \r, so line breaks are
+    # normalized in the same pass - then strip leading/trailing whitespace
+    return _WS_RE.sub(' ', text).strip()
 
 
 class TextProcessor:
     """Processes and manipulates text"""
     
+    stop_words: FrozenSet[str] = _STOPWORDS
+    
     def __init__(self):
         """Initialize TextProcessor"""
+        pass
+    
+    def warmup(self) -> None:
+        """Load the punkt tokenizer now instead of on the first hot-path call"""
         try:
-            self.stop_words = set(stopwords.words('english'))
+            sent_tokenize("Warm up.")
         except:
-            self.stop_words = set()
+            pass
     
     def normalize_text(self, text: str) -> str:
         """
@@ -36,36 +100,22 @@ class TextProcessor:
         Returns:
             Normalized text
         """
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Normalize line breaks
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        # Strip leading/trailing whitespace
-        return text.strip()
+        return _normalize(text)
     
-    def extract_keywords(self, text: str, n: int = 10) -> List[str]:
+    def extract_keywords(self, text: str, n: int = 10,
+                         stop_words: Optional[FrozenSet[str]] = None) -> List[str]:
         """
         Extract top N keywords from text using simple frequency
         
         Args:
             text: Input text
             n: Number of keywords to extract
+            stop_words: Precomputed stopword set (defaults to the shared English set)
             
         Returns:
             List of keywords
         """
-        # Tokenize and normalize
-        words = word_tokenize(text.lower())
-        
-        # Filter out stopwords and non-alphabetic tokens
-        words = [w for w in words if w.isalpha() and w not in self.stop_words]
-        
-        # Count frequencies
-        from collections import Counter
-        word_freq = Counter(words)
-        
-        # Get top N
-        return [word for word, _ in word_freq.most_common(n)]
+        return list(_top_keywords(text, n, stop_words if stop_words is not None else self.stop_words))
     
     def word_count(self, text: str) -> int:
         """
@@ -90,11 +140,8 @@ class TextProcessor:
         Returns:
             List of sentences
         """
-        try:
-            return sent_tokenize(text)
-        except:
-            # Fallback if NLTK fails
-            return [s.strip() for s in text.split('.') if s.strip()]
+        # Fresh list per call so callers can't mutate the cached entry
+        return list(_split_sentences(text))
     
     def remove_special_chars(self, text: str) -> str:
         """
@@ -107,7 +154,7 @@ class TextProcessor:
             Cleaned text
         """
         # Keep alphanumeric, spaces, and common punctuation
-        return re.sub(r'[^a-zA-Z0-9\s.,!?-]', '', text)
+        return _SPECIAL_RE.sub('', text)
     
     def truncate_words(self, text: str, max_words: int) -> str:
         """
@@ -3,15 +3,236 @@ Video Generator
 Creates video from PowerPoint presentation
 """
 import os
+import queue
+import struct
+import sys
 import tempfile
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 
+# Hardware H.264 encoders in preference order: (codec, flags before -i, flags after -i)
+_HW_ENCODERS = (
+    ('h264_nvenc', (), ('-preset', 'p4', '-rc', 'vbr', '-cq', '23', '-pix_fmt', 'yuv420p')),
+    ('h264_qsv', (), ('-preset', 'veryfast', '-global_quality', '23', '-pix_fmt', 'nv12')),
+    ('h264_vaapi', ('-vaapi_device', '/dev/dri/renderD128'), ('-vf', 'format=nv12,hwupload')),
+    ('h264_videotoolbox', (), ('-q:v', '65', '-pix_fmt', 'yuv420p')),
+)
+
+
+@lru_cache(maxsize=8)
+def _detect_hw_encoder(ffmpeg_exe: str) -> Optional[Tuple[str, Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    Find a hardware H.264 encoder that works on this machine
+    
+    Builds routinely list encoders the hardware can't run, so each listed
+    candidate is checked with a one-frame test encode. Cached per binary.
+    
+    Args:
+        ffmpeg_exe: Path to the ffmpeg binary
+        
+    Returns:
+        (codec, input flags, output flags), or None to use libx264
+    """
+    import subprocess
+    
+    try:
+        listing = subprocess.run(
+            [ffmpeg_exe, '-hide_banner', '-encoders'], capture_output=True, text=True, timeout=10
+        ).stdout
+    except Exception:
+        return None
+    
+    for codec, input_flags, output_flags in _HW_ENCODERS:
+        if codec not in listing:
+            continue
+        probe = [
+            ffmpeg_exe, '-hide_banner', '-loglevel', 'error', *input_flags,
+            '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+            '-frames:v', '1', '-c:v', codec, *output_flags, '-f', 'null', '-'
+        ]
+        try:
+            if subprocess.run(probe, capture_output=True, timeout=15).returncode == 0:
+                return codec, input_flags, output_flags
+        except Exception:
+            continue
+    return None
+
+
+# WAV format tags with a fixed byte rate: PCM, IEEE float, extensible
+_WAV_PCM_FORMATS = (0x0001, 0x0003, 0xFFFE)
+
+
+def _wav_duration(path: str) -> float:
+    """
+    Duration of a PCM WAV file from its RIFF headers alone
+    
+    Walks the chunk headers to 'fmt ' (byte rate) and 'data' (payload size)
+    without reading or decoding the audio.
+    
+    Args:
+        path: WAV file path
+        
+    Returns:
+        Duration in seconds
+        
+    Raises:
+        ValueError: If the file is not an uncompressed WAV or its headers are truncated
+    """
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12:
+            raise ValueError(f"Truncated WAV header in {path}")
+        riff, _, wave_id = struct.unpack('<4sI4s', header)
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError(f"Not a WAV file: {path}")
+        
+        byte_rate = 0
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk in {path}")
+            chunk_id, size = struct.unpack('<4sI', header)
+            
+            if chunk_id == b'fmt ':
+                fmt = f.read(12)
+                if len(fmt) < 12:
+                    raise ValueError(f"Truncated fmt chunk in {path}")
+                # Format tag, channels, sample rate, byte rate
+                format_tag, _, _, byte_rate = struct.unpack('<HHII', fmt)
+                # Compressed formats only report an average byte rate
+                if format_tag not in _WAV_PCM_FORMATS:
+                    raise ValueError(f"Unsupported WAV format 0x{format_tag:04x} in {path}")
+                f.seek(size - 12 + (size & 1), os.SEEK_CUR)
+            elif chunk_id == b'data':
+                if not byte_rate:
+                    raise ValueError(f"WAV data before fmt chunk in {path}")
+                # Streaming writers may leave the size unset, and a truncated
+                # file holds less than declared; use what's on disk
+                on_disk = os.fstat(f.fileno()).st_size - f.tell()
+                if size in (0, 0xFFFFFFFF) or size > on_disk:
+                    size = on_disk
+                return size / byte_rate
+            else:
+                # Chunks are word-aligned
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def _tail_stderr(proc, lines: int = 50) -> Tuple[deque, threading.Thread]:
+    """
+    Drain a child's stderr on a background thread, keeping only the last lines
+    
+    Keeps the OS pipe from filling (which would stall the child) without
+    holding all of ffmpeg's output in memory.
+    
+    Args:
+        proc: Popen object started with stderr=PIPE (binary mode)
+        lines: Number of trailing lines to keep
+        
+    Returns:
+        (deque of decoded lines, reader thread to join once the child exits)
+    """
+    tail = deque(maxlen=lines)
+    
+    def reader():
+        for line in proc.stderr:
+            tail.append(line.decode('utf-8', errors='replace'))
+        proc.stderr.close()
+    
+    thread = threading.Thread(target=reader, name='ffmpeg-stderr', daemon=True)
+    thread.start()
+    return tail, thread
+
+
+def _run_ffmpeg(cmd: List[str], timeout: Optional[float] = None) -> Tuple[int, str]:
+    """
+    Run an ffmpeg command, keeping only the tail of its stderr
+    
+    Args:
+        cmd: Full command line
+        timeout: Seconds before the process is killed and TimeoutExpired raised
+        
+    Returns:
+        (return code, last lines of stderr)
+    """
+    import subprocess
+    
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    tail, reader = _tail_stderr(proc)
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        reader.join()
+    return proc.returncode, ''.join(tail)
+
+
+# pyttsx3 engine for this process - created on first use, then reused
+_tts_engine = None
+
+
+def _get_tts_engine():
+    """Return this process's TTS engine, starting the speech driver once"""
+    global _tts_engine
+    if _tts_engine is None:
+        import pyttsx3
+        _tts_engine = pyttsx3.init()
+    return _tts_engine
+
+
+def _close_tts_engine() -> None:
+    """Stop and release this process's TTS engine, if one was started"""
+    global _tts_engine
+    if _tts_engine is not None:
+        try:
+            _tts_engine.stop()
+        except Exception:
+            pass
+        _tts_engine = None
+
+
+def _tts_worker(task: Tuple[str, str, int]) -> Optional[str]:
+    """
+    Render one narration to a WAV file (process pool entry point)
+    
+    pyttsx3 engines can't be pickled, so every process keeps its own and
+    reuses it for each slide it renders.
+    
+    Args:
+        task: (text, audio path, speech rate)
+        
+    Returns:
+        None on success, otherwise the error message
+    """
+    text, audio_path, rate = task
+    try:
+        engine = _get_tts_engine()
+        
+        # Configure voice
+        engine.setProperty('rate', rate)
+        engine.setProperty('volume', 0.8)
+        
+        # Generate audio
+        engine.save_to_file(text, audio_path)
+        engine.runAndWait()
+        return None
+    except Exception as e:
+        return str(e)
+
 
 class VideoGenerator:
     """Generates video from presentation"""
     
+    # On-screen captions used when narration can't be added
+    CAPTION_NO_TTS = "Text to Speech unavailable - displaying text captions"
+    CAPTION_REST = "View the slide content above"
+    
     def __init__(self, config: ConfigManager, logger: Logger):
         """
         Initialize video generator
@@ -26,12 +247,28 @@ class VideoGenerator:
         # Get video settings
         self.output_format = config.get_value('video.output_format', 'mp4')
         self.fps = config.get_value('video.fps', 30)
-        self.resolution_width = config.get_value('video.resolution.width', 1920)
-        self.resolution_height = config.get_value('video.resolution.height', 1080)
+        # yuv420p encoding needs even dimensions; round odd sizes down instead
+        # of letting ffmpeg reject them (or padding to 16 like imageio does)
+        self.resolution_width = int(config.get_value('video.resolution.width', 1920)) // 2 * 2
+        self.resolution_height = int(config.get_value('video.resolution.height', 1080)) // 2 * 2
         self.min_duration = config.get_value('video.min_slide_duration', 5)
         self.max_duration = config.get_value('video.max_slide_duration', 12)
         self.ken_burns = config.get_value('video.ken_burns_enabled', True)
         self.tts_rate = config.get_value('video.tts_rate', 150)
+        # x264 speed/size trade-off; slides are static so fast presets lose little
+        self.x264_preset = config.get_value('video.x264_preset', 'ultrafast')
+        # "auto" prefers a working hardware encoder, otherwise names the ffmpeg codec
+        self.encoder = config.get_value('video.encoder', 'auto')
+        
+        # Slide fonts, loaded on first render (PIL is imported lazily)
+        self._fonts = None
+        
+        # ffmpeg binary path, resolved on first use
+        self._ffmpeg_exe = None
+        
+        # Text layout shared by every slide and frame in the presentation
+        self._layout_cache: Dict[Tuple[str, int], List[str]] = {}
+        self._title_cache: Dict[str, Tuple[int, int]] = {}
     
     def create_video(self, presentation_path: str, output_path: str) -> None:
         """
@@ -83,17 +320,26 @@ class VideoGenerator:
                     'content': []
                 }
                 
-                # Extract text from all shapes
+                # Extract text from all shapes; shape.text walks every
+                # paragraph and run, so read it once per shape
                 for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        text = shape.text.strip()
-                        if not slide_data['title']:
-                            # First text shape is usually the title
-                            slide_data['title'] = text
-                        else:
-                            # Other text shapes are content
-                            if text:
-                                slide_data['content'].append(text)
+                    if not hasattr(shape, "text"):
+                        continue
+                    text = shape.text.strip()
+                    if not text:
+                        continue
+                    if not slide_data['title']:
+                        # First text shape is usually the title
+                        slide_data['title'] = text
+                    else:
+                        # Other text shapes are content
+                        slide_data['content'].append(text)
+                
+                # Speaker notes written by the slide assembler drive the narration
+                if slide.has_notes_slide:
+                    notes = slide.notes_slide.notes_text_frame.text.strip()
+                    if notes:
+                        slide_data['speaker_notes'] = notes
                 
                 slides_data.append(slide_data)
                 self.logger.debug(f"Extracted slide {slide_idx}: Title='{slide_data['title']}', Content lines={len(slide_data['content'])}")
@@ -121,14 +367,10 @@ class VideoGenerator:
             return False
         
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import tempfile
-            
-            frames_dir = tempfile.mkdtemp(prefix='video_frames_')
-            audio_files = []
+            work_dir = tempfile.mkdtemp(prefix='video_work_')
             
-            # Generate TTS audio for each slide
-            tts_audio_generated = False
+            # Narration text for each slide
+            narration = []
             for slide_idx, slide_data in enumerate(slide_content):
                 title = slide_data.get('title', '')
                 content_text = '\n'.join(slide_data.get('content', []))
@@ -146,94 +388,39 @@ class VideoGenerator:
                     if content_text:
                         full_text += f". {content_text}"
                 
-                if full_text:
-                    audio_path = self._generate_tts_audio(full_text, slide_idx, frames_dir)
-                    if audio_path:
-                        audio_files.append(audio_path)
-                        tts_audio_generated = True
-            
-            if tts_audio_generated:
-                self.logger.info(f"TTS audio generated for {len(audio_files)} slides")
+                narration.append(full_text)
+            
+            # GIF output carries no audio track, so no TTS is generated for it
+            is_gif = output_path.lower().endswith('.gif')
+            
+            # TTS runs ahead in worker processes while earlier slides are
+            # encoded; each slide is rendered as soon as its audio is ready.
+            # The pool is started here, before the renderer thread exists.
+            tts = None if is_gif else self._start_tts(narration, work_dir)
+            executor, futures = tts if tts is not None else (None, {})
+            if tts is None:
+                slide_audio = iter([None] * len(narration))
             else:
-                self.logger.warning("TTS not available")
-            
-            # Calculate actual audio durations to sync with video
-            audio_durations = []
-            for slide_idx, slide_data in enumerate(slide_content):
-                if slide_idx < len(audio_files) and audio_files[slide_idx] and os.path.exists(audio_files[slide_idx]):
-                    # Get audio duration from the file
-                    import wave
-                    try:
-                        with wave.open(audio_files[slide_idx], 'rb') as wf:
-                            audio_duration = wf.getnframes() / wf.getframerate()
-                            audio_durations.append(max(audio_duration, self.min_duration))
-                    except Exception as e:
-                        self.logger.warning(f"Could not get audio duration for slide {slide_idx}: {e}")
-                        audio_durations.append(self.min_duration)
-                else:
-                    audio_durations.append(self.min_duration)
-            
-            # Create frames for each slide using actual audio durations
-            frames_list = []
-            for slide_idx, slide_data in enumerate(slide_content):
-                title = slide_data.get('title', 'Slide ' + str(slide_idx + 1))
-                content_lines = slide_data.get('content', [])
-                
-                # Use actual audio duration for this slide to ensure sync
-                slide_duration = audio_durations[slide_idx] if slide_idx < len(audio_durations) else self.min_duration
-                
-                # Generate frames WITHOUT captions initially
-                slide_frames = self._create_slide_frames(
-                    title, content_lines, slide_duration, self.fps, show_captions=False
+                slide_audio = self._iter_tts(narration, work_dir, futures)
+            try:
+                # Stream frames straight into ffmpeg using actual audio durations;
+                # if the audio merge fails, captions are overlaid on the same encode
+                return self._create_video_with_ffmpeg(
+                    slide_content, self._iter_slide_timing(narration, slide_audio),
+                    output_path, show_captions=False
                 )
+            finally:
+                # Stops any TTS still queued if encoding ended early
+                for future in futures.values():
+                    future.cancel()
+                if executor is not None:
+                    executor.shutdown(wait=True)
+                _close_tts_engine()
                 
-                # Save frames to disk
-                for frame_idx, frame_img in enumerate(slide_frames):
-                    frame_path = os.path.join(frames_dir, f"slide_{slide_idx:02d}_frame_{frame_idx:04d}.png")
-                    frame_img.save(frame_path)
-                    frames_list.append(frame_path)
-            
-            # Create video using imageio which handles frame rates better
-            success = self._create_video_with_imageio(frames_list, output_path, audio_files)
-            
-            # If video creation failed, recreate frames WITH captions
-            if not success and tts_audio_generated:
-                self.logger.warning("Audio merge failed - recreating video with on-screen captions")
-                
-                # Clear old frames
-                for frame_path in frames_list:
-                    if os.path.exists(frame_path):
-                        os.remove(frame_path)
-                frames_list = []
-                
-                # Recreate frames with captions (use same audio durations for consistency)
-                for slide_idx, slide_data in enumerate(slide_content):
-                    title = slide_data.get('title', 'Slide ' + str(slide_idx + 1))
-                    content_lines = slide_data.get('content', [])
-                    
-                    # Use the same audio duration as before
-                    slide_duration = audio_durations[slide_idx] if slide_idx < len(audio_durations) else self.min_duration
-                    
-                    # Generate frames WITH captions
-                    slide_frames = self._create_slide_frames(
-                        title, content_lines, slide_duration, self.fps, show_captions=True
-                    )
-                    
-                    # Save frames to disk
-                    for frame_idx, frame_img in enumerate(slide_frames):
-                        frame_path = os.path.join(frames_dir, f"slide_{slide_idx:02d}_frame_{frame_idx:04d}.png")
-                        frame_img.save(frame_path)
-                        frames_list.append(frame_path)
-                
-                # Create video again with captions (without audio)
-                success = self._create_video_with_imageio(frames_list, output_path, [])
-            
-            # Cleanup
-            import shutil
-            if os.path.exists(frames_dir):
-                shutil.rmtree(frames_dir)
-            
-            return success
+                # Cleanup
+                import shutil
+                if os.path.exists(work_dir):
+                    shutil.rmtree(work_dir)
             
         except Exception as e:
             self.logger.error(f"Video creation from slides failed: {e}")
@@ -241,6 +428,144 @@ class VideoGenerator:
             self.logger.debug(traceback.format_exc())
             return False
     
+    def _iter_slide_timing(self, narration: List[str],
+                           slide_audio: Iterable[Optional[str]]) -> Iterator[Tuple[Optional[str], float]]:
+        """
+        Pair each slide's audio with the on-screen duration it needs
+        
+        Args:
+            narration: Narration text per slide
+            slide_audio: Audio path (or None) per slide, in slide order
+            
+        Yields:
+            (audio path or None, duration in seconds) per slide
+        """
+        for slide_idx, audio_path in enumerate(slide_audio):
+            if not narration[slide_idx].strip():
+                # Nothing to show or say - a zero duration leaves the blank slide out
+                yield None, 0
+            elif audio_path:
+                # Get audio duration from the file header
+                try:
+                    yield audio_path, max(_wav_duration(audio_path), self.min_duration)
+                except Exception as e:
+                    self.logger.warning(f"Could not get audio duration for slide {slide_idx}: {e}")
+                    yield audio_path, self.min_duration
+            else:
+                yield None, self.min_duration
+    
+    def _start_tts(self, texts: List[str], output_dir: str) -> Optional[Tuple[Any, Dict[int, Any]]]:
+        """
+        Submit every slide's narration to a pool of TTS worker processes
+        
+        Each slide's narration is independent, and one pyttsx3 engine renders
+        serially, so all slides are submitted up front. Workers are spawned
+        rather than forked: the parent is multi-threaded by the time video is
+        encoded, and forking it can copy locks held by other threads.
+        
+        Args:
+            texts: Narration text per slide (empty for none)
+            output_dir: Output directory for audio
+            
+        Returns:
+            (executor or None, futures by slide index) - empty when TTS runs
+            serially - or None if TTS is not available at all
+        """
+        try:
+            import pyttsx3
+        except Exception as e:
+            self.logger.warning(f"TTS not available: {e}")
+            return None
+        
+        pending = [idx for idx, text in enumerate(texts) if text.strip()]
+        workers = min(os.cpu_count() or 1, len(pending))
+        
+        # SAPI5 on Windows doesn't tolerate concurrent engines
+        if workers <= 1 or sys.platform == 'win32':
+            return None, {}
+        
+        executor = None
+        futures = {}
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            for idx in pending:
+                audio_path = os.path.join(output_dir, f"audio_{idx:02d}.wav")
+                futures[idx] = executor.submit(_tts_worker, (texts[idx], audio_path, self.tts_rate))
+            return executor, futures
+        except Exception as e:
+            self.logger.warning(f"Parallel TTS failed, generating serially: {e}")
+            # shutdown(cancel_futures=...) needs Python 3.9
+            for future in futures.values():
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+            return None, {}
+    
+    def _iter_tts(self, texts: List[str], output_dir: str, futures: Dict[int, Any]) -> Iterator[Optional[str]]:
+        """
+        Hand out each slide's TTS audio in slide order
+        
+        Args:
+            texts: Narration text per slide (empty for none)
+            output_dir: Output directory for audio
+            futures: Pool futures by slide index from _start_tts (empty to
+                generate serially)
+            
+        Yields:
+            Audio file path (or None) for each slide, in slide order
+        """
+        pool_ok = bool(futures)
+        for idx, text in enumerate(texts):
+            if not text.strip():
+                yield None
+                continue
+            
+            if pool_ok:
+                audio_path = os.path.join(output_dir, f"audio_{idx:02d}.wav")
+                try:
+                    yield self._check_tts_output(audio_path, idx, len(text), futures[idx].result())
+                    continue
+                except Exception as e:
+                    # Broken pool: this and the remaining slides go serial
+                    self.logger.warning(f"Parallel TTS failed, generating serially: {e}")
+                    pool_ok = False
+            
+            yield self._generate_tts_audio(text, idx, output_dir)
+    
+    def _check_tts_output(self, audio_path: str, slide_idx: int, text_len: int,
+                          error: Optional[str]) -> Optional[str]:
+        """
+        Validate a TTS output file and log the outcome
+        
+        Args:
+            audio_path: Expected audio file path
+            slide_idx: Slide index
+            text_len: Length of the narrated text
+            error: Error message from the synthesizer, if it failed
+            
+        Returns:
+            Path to audio file or None
+        """
+        if error is not None:
+            self.logger.warning(f"TTS generation failed for slide {slide_idx}: {error}")
+            return None
+        
+        # Single stat for existence and size
+        try:
+            size = os.stat(audio_path).st_size
+        except OSError:
+            size = 0
+        
+        if size > 0:
+            self.logger.debug(f"Generated TTS audio for slide {slide_idx}: {text_len} chars")
+            return audio_path
+        
+        self.logger.warning(f"TTS audio generation produced empty file for slide {slide_idx}")
+        return None
+    
     def _generate_tts_audio(self, text: str, slide_idx: int, output_dir: str) -> Optional[str]:
         """
         Generate TTS audio for text
@@ -255,34 +580,12 @@ class VideoGenerator:
         """
         try:
             import pyttsx3
-            
-            audio_path = os.path.join(output_dir, f"audio_{slide_idx:02d}.wav")
-            
-            try:
-                engine = pyttsx3.init()
-                
-                # Configure voice
-                engine.setProperty('rate', self.tts_rate)
-                engine.setProperty('volume', 0.8)
-                
-                # Generate audio
-                engine.save_to_file(text, audio_path)
-                engine.runAndWait()
-                
-                if os.path.exists(audio_path) and os.path.getsize(audio_path) > 0:
-                    self.logger.debug(f"Generated TTS audio for slide {slide_idx}: {len(text)} chars")
-                    return audio_path
-                else:
-                    self.logger.warning(f"TTS audio generation produced empty file for slide {slide_idx}")
-                    return None
-                    
-            except Exception as e:
-                self.logger.warning(f"TTS generation failed for slide {slide_idx}: {e}")
-                return None
-                
         except Exception as e:
             self.logger.warning(f"TTS not available: {e}")
             return None
+        
+        audio_path = os.path.join(output_dir, f"audio_{slide_idx:02d}.wav")
+        return self._check_tts_output(audio_path, slide_idx, len(text), _tts_worker((text, audio_path, self.tts_rate)))
     
     def _estimate_video_duration(self, audio_files: List[str], num_slides: int) -> float:
         """
@@ -329,10 +632,39 @@ class VideoGenerator:
         # Clamp between min and max duration
         return max(self.min_duration, min(self.max_duration, estimated_seconds))
     
-    def _create_slide_frames(self, title: str, content_lines: List[str], duration: float, fps: int, show_captions: bool = True) -> List:
+    def _get_fonts(self) -> tuple:
+        """
+        Load the title, content and caption fonts once per generator
+        
+        Returns:
+            (title_font, content_font, small_font)
+        """
+        if self._fonts is None:
+            from PIL import ImageFont
+            
+            try:
+                self._fonts = (
+                    ImageFont.truetype("arial.ttf", 64),
+                    ImageFont.truetype("arial.ttf", 32),
+                    ImageFont.truetype("arial.ttf", 28),
+                )
+            except:
+                default_font = ImageFont.load_default()
+                self._fonts = (default_font, default_font, default_font)
+            
+            # Word widths for line wrapping, shared by every slide
+            content_font = self._fonts[1]
+            self._space_width = content_font.getlength(' ')
+            self._word_length = lru_cache(maxsize=4096)(content_font.getlength)
+        return self._fonts
+    
+    def _create_slide_frames(self, title: str, content_lines: List[str], duration: float, fps: int, show_captions: bool = True) -> Iterator:
         """
         Create visual frames for a slide
         
+        The slide is static, so it is rendered once and handed out as runs of
+        identical frames rather than redrawn for every frame.
+        
         Args:
             title: Slide title
             content_lines: List of content lines
@@ -340,75 +672,78 @@ class VideoGenerator:
             fps: Frames per second
             show_captions: Whether to show text captions on frames
             
-        Returns:
-            List of PIL Image objects
+        Yields:
+            (PIL Image, frame count) pairs, in playback order
         """
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
         
-        frames = []
         num_frames = int(duration * fps)
+        if num_frames <= 0:
+            return
         
-        # Load font
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 64)
-            content_font = ImageFont.truetype("arial.ttf", 32)
-            small_font = ImageFont.truetype("arial.ttf", 28)
-        except:
-            title_font = ImageFont.load_default()
-            content_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-        
-        for i in range(num_frames):
-            # Create frame
-            frame = Image.new('RGB', (self.resolution_width, self.resolution_height), color='#E8F4F8')
-            draw = ImageDraw.Draw(frame)
-            
-            # Draw title
+        title_font, content_font, small_font = self._get_fonts()
+        
+        # Create frame
+        frame = Image.new('RGB', (self.resolution_width, self.resolution_height), color='#E8F4F8')
+        draw = ImageDraw.Draw(frame)
+        
+        # Draw title
+        title_layout = self._title_cache.get(title)
+        if title_layout is None:
             bbox = draw.textbbox((0, 0), title, font=title_font)
             title_width = bbox[2] - bbox[0]
-            title_x = (self.resolution_width - title_width) // 2
-            draw.text((title_x, 150), title, fill='#4A90E2', font=title_font)
-            
-            # Draw content lines - properly formatted with bullets and line breaks
-            y_offset = 350
-            line_height = 70  # Increased spacing between items
-            bullet_height = 60  # Spacing within a bullet item
-            max_width = self.resolution_width - 600  # Left and right margins
-            x_start = 250  # Starting position
-            
-            # Space between bullet items
-            item_spacing = 30
-            
-            for idx, line in enumerate(content_lines):
-                if not line.strip() or y_offset >= self.resolution_height - 100:
-                    continue
-                
-                # Check if this is a bullet point (starts with • or - or is a bullet)
-                is_bullet = line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('\u2022')
-                
-                # Extract bullet symbol if present
-                bullet_symbol = ''
-                if is_bullet:
-                    clean_line = line.strip()[1:].strip()  # Remove first character
-                    bullet_symbol = '• '
-                else:
-                    clean_line = line.strip()
-                
-                # Add spacing between items
-                if idx > 0:
-                    y_offset += item_spacing
-                
-                if clean_line:
-                    # Word wrap if line is too long
+            title_layout = ((self.resolution_width - title_width) // 2, title_width)
+            self._title_cache[title] = title_layout
+        title_x, title_width = title_layout
+        draw.text((title_x, 150), title, fill='#4A90E2', font=title_font)
+        
+        # Draw content lines - properly formatted with bullets and line breaks
+        y_offset = 350
+        line_height = 70  # Increased spacing between items
+        bullet_height = 60  # Spacing within a bullet item
+        max_width = self.resolution_width - 600  # Left and right margins
+        x_start = 250  # Starting position
+        
+        # Space between bullet items
+        item_spacing = 30
+        
+        # Font metrics are fixed, so measure each distinct word (and the
+        # space) once by glyph advance instead of a textbbox per word
+        space_width = self._space_width
+        word_length = self._word_length
+        
+        for idx, line in enumerate(content_lines):
+            if not line.strip() or y_offset >= self.resolution_height - 100:
+                continue
+            
+            # Check if this is a bullet point (starts with • or - or is a bullet)
+            is_bullet = line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('\u2022')
+            
+            # Extract bullet symbol if present
+            bullet_symbol = ''
+            if is_bullet:
+                clean_line = line.strip()[1:].strip()  # Remove first character
+                bullet_symbol = '• '
+            else:
+                clean_line = line.strip()
+            
+            # Add spacing between items
+            if idx > 0:
+                y_offset += item_spacing
+            
+            if clean_line:
+                # Word wrap if line is too long; wrapping depends only on the
+                # text and width, so repeated lines reuse an earlier layout
+                layout_key = (clean_line, max_width)
+                wrapped_lines = self._layout_cache.get(layout_key)
+                if wrapped_lines is None:
                     words = clean_line.split()
                     wrapped_lines = []
                     current_line = []
                     current_width = 0
                     
                     for word in words:
-                        word_bbox = draw.textbbox((0, 0), word, font=content_font)
-                        word_width = word_bbox[2] - word_bbox[0]
-                        space_width = draw.textbbox((0, 0), ' ', font=content_font)[2] - draw.textbbox((0, 0), ' ', font=content_font)[0]
+                        word_width = word_length(word)
                         
                         if current_width + word_width + space_width < max_width:
                             current_line.append(word)
@@ -421,477 +756,486 @@ class VideoGenerator:
                     
                     if current_line:
                         wrapped_lines.append(' '.join(current_line))
-                    
-                    # Draw wrapped lines with bullet
-                    for line_idx, wrapped_line in enumerate(wrapped_lines):
-                        if y_offset < self.resolution_height - 100:
-                            # For first line of bullet, add bullet symbol
-                            if line_idx == 0 and bullet_symbol:
-                                # Draw bullet symbol
-                                bullet_bbox = draw.textbbox((0, 0), bullet_symbol, font=content_font)
-                                draw.text((x_start, y_offset), bullet_symbol, fill='#4A90E2', font=content_font)
-                                # Draw text starting after bullet
-                                text_x = x_start + (bullet_bbox[2] - bullet_bbox[0]) + 10
-                                draw.text((text_x, y_offset), wrapped_line, fill='#2C3E50', font=content_font)
-                            else:
-                                # Draw wrapped line without bullet (indented for continuation)
-                                draw.text((x_start + 30, y_offset), wrapped_line, fill='#2C3E50', font=content_font)
-                            
-                            # Use different spacing for first line vs wrapped lines
-                            y_offset += bullet_height if line_idx == 0 else (bullet_height - 15)
-            
-            # Add caption indicator at bottom
-            if show_captions:
-                # Show text on all frames when no TTS
-                if i < num_frames // 4:  # Show in first quarter of frames
-                    caption_text = "Text to Speech unavailable - displaying text captions"
-                else:
-                    caption_text = "View the slide content above"
+                    self._layout_cache[layout_key] = wrapped_lines
                 
-                bbox = draw.textbbox((0, 0), caption_text, font=small_font)
-                caption_width = bbox[2] - bbox[0]
-                caption_x = (self.resolution_width - caption_width) // 2
-                caption_y = self.resolution_height - 60
-                
-                # Draw background for caption
-                padding = 10
-                draw.rectangle(
-                    [caption_x - padding, caption_y - padding, 
-                     caption_x + caption_width + padding, caption_y + 40 + padding],
-                    fill='#FFFFFF',
-                    outline='#4A90E2',
-                    width=2
-                )
-                
-                draw.text((caption_x, caption_y), caption_text, fill='#2C3E50', font=small_font)
-            
-            frames.append(frame)
+                # Draw wrapped lines with bullet
+                for line_idx, wrapped_line in enumerate(wrapped_lines):
+                    if y_offset < self.resolution_height - 100:
+                        # For first line of bullet, add bullet symbol
+                        if line_idx == 0 and bullet_symbol:
+                            # Draw bullet symbol
+                            bullet_bbox = draw.textbbox((0, 0), bullet_symbol, font=content_font)
+                            draw.text((x_start, y_offset), bullet_symbol, fill='#4A90E2', font=content_font)
+                            # Draw text starting after bullet
+                            text_x = x_start + (bullet_bbox[2] - bullet_bbox[0]) + 10
+                            draw.text((text_x, y_offset), wrapped_line, fill='#2C3E50', font=content_font)
+                        else:
+                            # Draw wrapped line without bullet (indented for continuation)
+                            draw.text((x_start + 30, y_offset), wrapped_line, fill='#2C3E50', font=content_font)
+                        
+                        # Use different spacing for first line vs wrapped lines
+                        y_offset += bullet_height if line_idx == 0 else (bullet_height - 15)
         
-        return frames
+        if not show_captions:
+            yield frame, num_frames
+            return
+        
+        # Show text on all frames when no TTS: one caption for the first
+        # quarter of the frames, another for the rest
+        caption_frames = num_frames // 4
+        for caption_text, count in (
+            (self.CAPTION_NO_TTS, caption_frames),
+            (self.CAPTION_REST, num_frames - caption_frames),
+        ):
+            if count <= 0:
+                continue
+            
+            captioned = frame.copy()
+            self._draw_caption(ImageDraw.Draw(captioned), caption_text, small_font)
+            
+            yield captioned, count
     
+    def _draw_caption(self, draw, caption_text: str, font) -> None:
+        """
+        Draw a boxed caption centred at the bottom of the frame
+        
+        Args:
+            draw: ImageDraw for the frame or overlay layer
+            caption_text: Caption to draw
+            font: Caption font
+        """
+        bbox = draw.textbbox((0, 0), caption_text, font=font)
+        caption_width = bbox[2] - bbox[0]
+        caption_x = (self.resolution_width - caption_width) // 2
+        caption_y = self.resolution_height - 60
+        
+        # Draw background for caption
+        padding = 10
+        draw.rectangle(
+            [caption_x - padding, caption_y - padding, 
+             caption_x + caption_width + padding, caption_y + 40 + padding],
+            fill='#FFFFFF',
+            outline='#4A90E2',
+            width=2
+        )
+        
+        draw.text((caption_x, caption_y), caption_text, fill='#2C3E50', font=font)
     
-    def _create_video_with_imageio(self, frames_list: List[str], output_path: str, audio_files: List[str]) -> bool:
+    def _overlay_captions(self, video_path: str, frame_counts: List[int], output_path: str) -> bool:
         """
-        Create video with imageio and add audio with ffmpeg
+        Burn the no-audio captions into an already encoded video
+        
+        The two captions are rendered once as transparent layers and composited
+        by ffmpeg, switching per slide on frame number, so no slide frames are
+        re-rendered.
         
         Args:
-            frames_list: List of frame paths
+            video_path: Encoded video without captions
+            frame_counts: Number of frames of each slide, in order
             output_path: Output video path
-            audio_files: List of audio paths
             
         Returns:
             True if successful
         """
+        from PIL import Image, ImageDraw
+        
+        small_font = self._get_fonts()[2]
+        
+        # Frame ranges showing the first caption: first quarter of each slide
+        spans = []
+        start = 0
+        for count in frame_counts:
+            # Blank slides contribute no frames
+            if count <= 0:
+                continue
+            quarter = count // 4
+            if quarter > 0:
+                spans.append(f"between(n,{start},{start + quarter - 1})")
+            start += count
+        first_caption = '+'.join(spans) or '0'
+        
+        base, _ = os.path.splitext(output_path)
+        layer_paths = []
         try:
-            import imageio
-            import subprocess
-            import tempfile
+            for i, caption_text in enumerate((self.CAPTION_NO_TTS, self.CAPTION_REST)):
+                layer = Image.new('RGBA', (self.resolution_width, self.resolution_height), (0, 0, 0, 0))
+                self._draw_caption(ImageDraw.Draw(layer), caption_text, small_font)
+                layer_path = f"{base}_caption_{i}.png"
+                layer.save(layer_path)
+                layer_paths.append(layer_path)
             
-            # Create video from frames using imageio
-            self.logger.info(f"Creating video with imageio from {len(frames_list)} frames...")
-            
-            # Read all images into memory
-            images = []
-            for frame_path in frames_list:
-                if os.path.exists(frame_path):
-                    img = imageio.imread(frame_path)
-                    images.append(img)
-            
-            # Create temporary video file
-            temp_video = output_path.replace('.mp4', '_temp_video.mp4')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Write video using imageio
-            imageio.mimwrite(temp_video, images, fps=self.fps, codec='libx264')
+            cmd = [
+                self._get_ffmpeg_exe(), '-y',
+                '-loglevel', 'error',
+                '-i', video_path,
+                '-i', layer_paths[0],
+                '-i', layer_paths[1],
+                '-filter_complex',
+                f"[0:v][1:v]overlay=enable='{first_caption}'[v1];"
+                f"[v1][2:v]overlay=enable='not({first_caption})'",
+                *self._x264_args(),
+                output_path
+            ]
+            returncode, stderr = _run_ffmpeg(cmd)
             
-            if not os.path.exists(temp_video) or os.path.getsize(temp_video) < 1000:
-                self.logger.error("Failed to create temp video with imageio")
+            if returncode != 0:
+                self.logger.error(f"Caption overlay failed: {stderr[-500:]}")
                 return False
-            
-            # If audio files exist, merge them
-            if audio_files and len(audio_files) > 0:
-                return self._merge_audio_to_video(temp_video, audio_files, output_path)
-            else:
-                # No audio, just move temp video to output
-                import shutil
-                shutil.move(temp_video, output_path)
-                return True
-                
+            return os.path.exists(output_path)
+        
         except Exception as e:
-            self.logger.error(f"Failed to create video with imageio: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            self.logger.error(f"Caption overlay failed: {e}")
             return False
+        
+        finally:
+            for layer_path in layer_paths:
+                if os.path.exists(layer_path):
+                    os.remove(layer_path)
     
-    def _merge_audio_to_video(self, temp_video: str, audio_files: List[str], output_path: str) -> bool:
+    
+    def _get_ffmpeg_exe(self) -> str:
         """
-        Merge audio files to video
+        Locate the ffmpeg binary bundled with imageio-ffmpeg
+        
+        Resolved once per generator; later calls return the cached path.
+        
+        Returns:
+            Path to ffmpeg executable (falls back to system ffmpeg)
+        """
+        if self._ffmpeg_exe is None:
+            try:
+                import imageio_ffmpeg
+                self._ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+            except Exception as e:
+                self.logger.warning(f"Could not find imageio ffmpeg, trying system ffmpeg: {e}")
+                self._ffmpeg_exe = 'ffmpeg'
+        return self._ffmpeg_exe
+    
+    def _x264_args(self) -> Tuple[str, ...]:
+        """
+        Output flags for the libx264 encoder
+        
+        This encode is the bitstream that ships: the audio merge copies it
+        without re-encoding. The preset sets speed versus file size at
+        x264's default CRF 23 quality (ultrafast: fastest, largest files).
+        
+        Returns:
+            ffmpeg flags selecting libx264 with the configured preset
+        """
+        # stillimage tunes x264 for slideshow-like content; -threads 0 uses every core
+        return ('-c:v', 'libx264', '-preset', self.x264_preset, '-tune', 'stillimage',
+                '-threads', '0', '-pix_fmt', 'yuv420p')
+    
+    def _video_encoder_args(self, ffmpeg_exe: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Pick the H.264 encoder according to video.encoder
         
         Args:
-            temp_video: Path to video without audio
-            audio_files: List of audio file paths
-            output_path: Final output path
+            ffmpeg_exe: Path to the ffmpeg binary
+            
+        Returns:
+            (flags before -i, flags after -i) for the ffmpeg command
+        """
+        x264 = ((), self._x264_args())
+        
+        if self.encoder == 'auto':
+            detected = _detect_hw_encoder(ffmpeg_exe)
+            if detected is None:
+                return x264
+            codec, input_flags, output_flags = detected
+            self.logger.info(f"Using hardware encoder: {codec}")
+            return input_flags, ('-c:v', codec) + output_flags
+        
+        if self.encoder == 'libx264':
+            return x264
+        
+        # Explicit codec: known hardware encoders get their setup flags
+        for codec, input_flags, output_flags in _HW_ENCODERS:
+            if codec == self.encoder:
+                return input_flags, ('-c:v', codec) + output_flags
+        return (), ('-c:v', self.encoder, '-pix_fmt', 'yuv420p')
+    
+    @staticmethod
+    def _fill_yuv420(frame_img, planes) -> None:
+        """
+        Convert an RGB frame into preallocated Y, Cb, Cr planes (4:2:0)
+        
+        Args:
+            frame_img: RGB PIL image with even width and height
+            planes: (Y, Cb, Cr) uint8 arrays; chroma planes are half size
+        """
+        import numpy as np
+        
+        ycbcr = np.asarray(frame_img.convert('YCbCr'))
+        np.copyto(planes[0], ycbcr[..., 0])
+        
+        # Chroma: rounded mean of each 2x2 block
+        for channel, plane in ((1, planes[1]), (2, planes[2])):
+            c = ycbcr[..., channel].astype(np.uint16)
+            plane[...] = (c[0::2, 0::2] + c[0::2, 1::2] + c[1::2, 0::2] + c[1::2, 1::2] + 2) >> 2
+    
+    def _create_video_with_ffmpeg(self, slide_content: List[Dict[str, Any]],
+                                  slide_timing: Iterable[Tuple[Optional[str], float]],
+                                  output_path: str, show_captions: bool) -> bool:
+        """
+        Encode slide frames by piping raw YUV 4:2:0 data into a single ffmpeg process,
+        then add audio with ffmpeg
+        
+        Args:
+            slide_content: List of slide content dictionaries
+            slide_timing: (audio path or None, duration in seconds) per slide,
+                consumed as each slide is encoded
+            output_path: Output video path
+            show_captions: Whether to show text captions on frames
             
         Returns:
             True if successful
         """
         try:
             import subprocess
-            import tempfile
-            import imageio_ffmpeg
-            
-            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-            
-            # Concatenate audio files
-            temp_audio = output_path.replace('.mp4', '_merged_audio.wav')
-            audio_list_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8')
-            
-            for audio_file in audio_files:
-                if os.path.exists(audio_file):
-                    abs_path = os.path.abspath(audio_file).replace('\\', '/')
-                    audio_list_file.write(f"file '{abs_path}'\n")
-            
-            audio_list_file.close()
-            
-            # Concatenate
-            concat_cmd = [
-                ffmpeg_exe, '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', audio_list_file.name,
-                '-acodec', 'pcm_s16le',
-                '-ar', '22050',
-                temp_audio
-            ]
+            import numpy as np
             
-            self.logger.info(f"Concatenating {len(audio_files)} audio files to: {temp_audio}")
+            # GIF output carries no audio track
+            is_gif = output_path.lower().endswith('.gif')
             
-            concat_result = subprocess.run(concat_cmd, capture_output=True, text=True, timeout=60)
+            # Whether audio arrives is only known once every slide is done,
+            # so MP4 is encoded to a temp file first
+            base, ext = os.path.splitext(output_path)
+            temp_video = output_path if is_gif else f"{base}_temp_video{ext}"
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            if concat_result.returncode != 0:
-                self.logger.error(f"Audio concatenation failed: {concat_result.stderr[:500]}")
-                if os.path.exists(audio_list_file.name):
-                    os.remove(audio_list_file.name)
-                return False
-                
-            if not os.path.exists(temp_audio):
-                self.logger.error("Concatenated audio file not created")
-                if os.path.exists(audio_list_file.name):
-                    os.remove(audio_list_file.name)
-                return False
-                
-            self.logger.info(f"Audio concatenated successfully: {os.path.getsize(temp_audio)} bytes")
+            ffmpeg_exe = self._get_ffmpeg_exe()
+            input_flags, output_flags = ((), ()) if is_gif else self._video_encoder_args(ffmpeg_exe)
             
-            # Merge audio with video
-            # Don't use -shortest, let video determine the duration
-            # Use map to ensure both streams are included
-            merge_cmd = [
+            cmd = [
                 ffmpeg_exe, '-y',
-                '-i', temp_video,
-                '-i', temp_audio,
-                '-c:v', 'copy',
-                '-c:a', 'aac',
-                '-map', '0:v:0',
-                '-map', '1:a:0',
-                output_path
+                '-loglevel', 'error',
+                *input_flags,
+                '-f', 'rawvideo',
+                # Planar 4:2:0 (full-range, as PIL's YCbCr) - half the bytes of rgb24
+                '-pix_fmt', 'yuvj420p',
+                '-s', f'{self.resolution_width}x{self.resolution_height}',
+                '-r', str(self.fps),
+                '-i', 'pipe:'
             ]
+            cmd += output_flags
+            cmd.append(temp_video)
+            
+            self.logger.info(f"Streaming frames for {len(slide_content)} slides to ffmpeg...")
+            
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                # 1 MB pipe buffer keeps stdin write syscalls large
+                bufsize=1 << 20
+            )
+            stderr_tail, stderr_reader = _tail_stderr(proc)
+            
+            width, height = self.resolution_width, self.resolution_height
+            luma_size, chroma_size = width * height, (width // 2) * (height // 2)
+            
+            # Rendering (PIL draw + YUV conversion) runs on its own thread and
+            # hands finished frames over a bounded queue, so it overlaps with
+            # ffmpeg encoding instead of alternating with it
+            frames: queue.Queue = queue.Queue(maxsize=8)
+            stop = threading.Event()
+            render_errors = []
+            audio_files = []
+            durations = []
             
-            merge_result = subprocess.run(merge_cmd, capture_output=True, text=True, timeout=120)
-            
-            # Log merge result
-            if merge_result.returncode != 0:
-                self.logger.error(f"Audio merge failed: {merge_result.stderr[:500]}")
-            else:
-                self.logger.info(f"Audio merge completed successfully")
-            
-            # Cleanup
-            if os.path.exists(audio_list_file.name):
-                os.remove(audio_list_file.name)
-            if os.path.exists(temp_audio):
-                os.remove(temp_audio)
-            if os.path.exists(temp_video):
-                os.remove(temp_video)
+            def render_worker():
+                try:
+                    timing = iter(slide_timing)
+                    for slide_idx, slide_data in enumerate(slide_content):
+                        title = slide_data.get('title', 'Slide ' + str(slide_idx + 1))
+                        content_lines = slide_data.get('content', [])
+                        
+                        # Use actual audio duration for this slide to ensure sync
+                        # (waits here until this slide's TTS has finished)
+                        audio_path, slide_duration = next(timing, (None, self.min_duration))
+                        if audio_path:
+                            audio_files.append(audio_path)
+                        durations.append(slide_duration)
+                        
+                        for frame_img, repeat_count in self._create_slide_frames(
+                            title, content_lines, slide_duration, self.fps, show_captions=show_captions
+                        ):
+                            if stop.is_set():
+                                return
+                            if frame_img.mode != 'RGB':
+                                frame_img = frame_img.convert('RGB')
+                            # rawvideo needs a fixed frame size; scale anything that differs
+                            if frame_img.size != (width, height):
+                                frame_img = frame_img.resize((width, height))
+                            
+                            # Y plane, then Cb, Cr; a fresh buffer per run since
+                            # the writer may still be sending the previous one
+                            frame_buf = np.empty(luma_size + 2 * chroma_size, dtype=np.uint8)
+                            self._fill_yuv420(frame_img, (
+                                frame_buf[:luma_size].reshape(height, width),
+                                frame_buf[luma_size:luma_size + chroma_size].reshape(height // 2, width // 2),
+                                frame_buf[luma_size + chroma_size:].reshape(height // 2, width // 2),
+                            ))
+                            frames.put((memoryview(frame_buf), repeat_count))
+                except Exception as e:
+                    render_errors.append(e)
+                finally:
+                    frames.put(None)
             
-            if merge_result.returncode == 0 and os.path.exists(output_path):
-                self.logger.info("Successfully merged audio with video")
-                return True
-            else:
-                self.logger.error("Failed to merge audio")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Failed to merge audio: {e}")
-            return False
-    
-    
-    def _try_ffmpeg_mp4_from_files(self, frames_list: List[str], output_path: str) -> bool:
-        """Try creating MP4 with ffmpeg from frame files"""
-        try:
-            import subprocess
-            import tempfile
+            renderer = threading.Thread(target=render_worker, name='slide-render', daemon=True)
+            renderer.start()
             
-            if not frames_list:
-                self.logger.error("No frames to create video from")
-                return False
-            
-            # Get ffmpeg executable from imageio
+            frame_count = 0
+            finished = False
             try:
-                import imageio_ffmpeg
-                ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-                self.logger.debug(f"Using ffmpeg from imageio: {ffmpeg_exe}")
-            except Exception as e:
-                self.logger.warning(f"Could not find imageio ffmpeg, trying system ffmpeg: {e}")
-                ffmpeg_exe = 'ffmpeg'
+                # Drain to the end-of-stream marker even if ffmpeg dies, so the
+                # renderer is never left blocked on a full queue
+                while True:
+                    item = frames.get()
+                    if item is None:
+                        break
+                    if stop.is_set():
+                        continue
+                    frame_view, repeat_count = item
+                    try:
+                        # Convert once, then send the same bytes for every frame in the run
+                        for _ in range(repeat_count):
+                            proc.stdin.write(frame_view)
+                        frame_count += repeat_count
+                    except BrokenPipeError:
+                        # ffmpeg exited early - the reason is reported on stderr below
+                        stop.set()
+                finished = True
+            finally:
+                if not finished:
+                    # Interrupted mid-stream: stop ffmpeg and the renderer, and
+                    # keep draining so the renderer can reach its sentinel
+                    stop.set()
+                    proc.kill()
+                    while frames.get() is not None:
+                        pass
+                renderer.join()
+                if not finished:
+                    proc.wait()
+                    stderr_reader.join()
+            
+            if render_errors:
+                proc.kill()
+                proc.wait()
+                raise render_errors[0]
             
-            # Create a temporary file listing frame paths
-            self.logger.info(f"Creating frame list file for {len(frames_list)} frames...")
-            concat_file = None
-            valid_frames = 0
             try:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-                    for i, frame_path in enumerate(frames_list):
-                        if os.path.exists(frame_path):
-                            abs_path = os.path.abspath(frame_path).replace('\\', '/')
-                            f.write(f"file '{abs_path}'\n")
-                            valid_frames += 1
-                        else:
-                            self.logger.warning(f"Frame {i} not found: {frame_path}")
-                    concat_file = f.name
-            except Exception as e:
-                self.logger.error(f"Failed to create frame list: {e}")
-                return False
-            
-            self.logger.info(f"Frame list created with {valid_frames} valid frames")
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            proc.wait()
+            stderr_reader.join()
             
-            if not os.path.exists(concat_file):
-                self.logger.error("Frame list file was not created")
+            if proc.returncode != 0:
+                self.logger.error(f"ffmpeg encode failed: {''.join(stderr_tail)[-500:]}")
                 return False
             
-            self.logger.info(f"Running ffmpeg with frame list: {concat_file}")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            cmd = [
-                ffmpeg_exe,
-                '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_file,
-                '-vf', f'scale={self.resolution_width}:{self.resolution_height},fps={self.fps}',
-                '-c:v', 'libx264',
-                '-pix_fmt', 'yuv420p',
-                '-r', str(self.fps),
-                '-vsync', 'cfr',
-                output_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            
-            # Cleanup concat file
-            if os.path.exists(concat_file):
-                os.remove(concat_file)
-            
-            if result.returncode != 0:
-                self.logger.error(f"ffmpeg failed: {result.stderr}")
+            if not os.path.exists(temp_video) or os.path.getsize(temp_video) < 1000:
+                self.logger.error("Failed to create temp video with ffmpeg")
                 return False
             
-            if not os.path.exists(output_path):
-                self.logger.error(f"Output file was not created: {output_path}")
-                return False
+            self.logger.info(f"Encoded {frame_count} frames")
             
-            if os.path.getsize(output_path) <= 1000:
-                self.logger.error(f"Output file is too small: {os.path.getsize(output_path)} bytes")
-                return False
+            if audio_files:
+                self.logger.info(f"TTS audio generated for {len(audio_files)} slides")
+            else:
+                self.logger.warning("TTS not available")
             
-            self.logger.info(f"Successfully created MP4 with ffmpeg: {output_path}")
-            return True
+            if is_gif:
+                return True
             
+            # If audio files exist, merge them
+            try:
+                if not audio_files:
+                    os.replace(temp_video, output_path)
+                    return True
+                
+                if self._merge_audio_to_video(temp_video, audio_files, output_path):
+                    return True
+                
+                # Caption the silent encode we already have instead of
+                # rendering every frame again
+                self.logger.warning("Audio merge failed - adding on-screen captions to the silent video")
+                frame_counts = [int(d * self.fps) for d in durations]
+                return self._overlay_captions(temp_video, frame_counts, output_path)
+            finally:
+                if os.path.exists(temp_video):
+                    os.remove(temp_video)
+                
         except Exception as e:
-            self.logger.error(f"ffmpeg MP4 failed: {e}")
+            self.logger.error(f"Failed to create video with ffmpeg: {e}")
             import traceback
             self.logger.debug(traceback.format_exc())
             return False
     
-    def _create_video_with_audio_track(self, frames_list: List[str], audio_files: List[str], output_path: str) -> bool:
+    def _merge_audio_to_video(self, temp_video: str, audio_files: List[str], output_path: str) -> bool:
         """
-        Create video with audio track using ffmpeg
+        Merge audio files to video
+        
+        The narration clips are joined by ffmpeg's concat filter and muxed with
+        the video in the same process, so no intermediate WAV is written. The
+        video stream is copied, not re-encoded, so the output keeps the
+        quality and size of the temp encode (see _x264_args / video.x264_preset).
         
         Args:
-            frames_list: List of frame paths
-            audio_files: List of audio paths
-            output_path: Output video path
+            temp_video: Path to video without audio
+            audio_files: List of audio file paths
+            output_path: Final output path
             
         Returns:
             True if successful
         """
         try:
-            import subprocess
-            import tempfile
-            
-            # Get ffmpeg executable from imageio
-            try:
-                import imageio_ffmpeg
-                ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-                self.logger.debug(f"Using ffmpeg from imageio: {ffmpeg_exe}")
-            except Exception as e:
-                self.logger.warning(f"Could not find imageio ffmpeg, trying system ffmpeg: {e}")
-                ffmpeg_exe = 'ffmpeg'
-            
-            self.logger.info(f"Creating temporary video without audio from {len(frames_list)} frames...")
-            # First create video without audio
-            temp_video = output_path.replace('.mp4', '_temp.mp4')
-            
-            # Log first few frames for debugging
-            if frames_list:
-                self.logger.debug(f"First frame: {frames_list[0]}")
-                self.logger.debug(f"Last frame: {frames_list[-1] if len(frames_list) > 1 else 'only frame'}")
-            
-            if not self._try_ffmpeg_mp4_from_files(frames_list, temp_video):
-                self.logger.error("Failed to create temp video for audio merging")
-                return False
-            
-            if not os.path.exists(temp_video):
-                self.logger.error("Temp video was not created")
+            # One directory listing per audio directory instead of a stat per file
+            existing = set()
+            for audio_dir in {os.path.dirname(audio_file) for audio_file in audio_files}:
+                with os.scandir(audio_dir or '.') as entries:
+                    existing.update(os.path.join(audio_dir, entry.name) for entry in entries)
+            audio_files = [audio_file for audio_file in audio_files if audio_file in existing]
+            if not audio_files:
+                self.logger.error("No audio files to merge")
                 return False
             
-            # Log temp video info
-            temp_video_size = os.path.getsize(temp_video)
-            self.logger.info(f"Temp video created: {temp_video_size} bytes")
-            
-            # Check temp video with ffprobe if available
-            try:
-                import imageio_ffmpeg
-                ffprobe = imageio_ffmpeg.get_ffmpeg_exe().replace('ffmpeg.exe', 'ffprobe.exe')
-                probe_cmd = [
-                    ffprobe,
-                    '-v', 'error',
-                    '-show_entries', 'stream=duration,nb_frames,codec_type',
-                    '-of', 'csv=p=0',
-                    temp_video
-                ]
-                probe_result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=10)
-                if probe_result.returncode == 0:
-                    self.logger.info(f"Temp video info: {probe_result.stdout.strip()}")
-            except Exception as e:
-                self.logger.debug(f"Could not probe temp video: {e}")
-            
-            # Combine audio files into one
-            self.logger.info(f"Combining {len(audio_files)} audio files...")
-            temp_audio = output_path.replace('.mp4', '_temp_audio.wav')
-            audio_list_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8')
-            
+            # Input 0 is the video, inputs 1..N the narration clips in slide order
+            cmd = [self._get_ffmpeg_exe(), '-y', '-nostats', '-loglevel', 'warning', '-i', temp_video]
             for audio_file in audio_files:
-                if os.path.exists(audio_file):
-                    # Use absolute path and normalize separators
-                    abs_path = os.path.abspath(audio_file).replace('\\', '/')
-                    audio_list_file.write(f"file '{abs_path}'\n")
-            
-            audio_list_file.close()
-            
-            # Concatenate audio files
-            self.logger.info(f"Concatenating {len(audio_files)} audio files...")
-            
-            # Log audio files for debugging
-            for i, audio_file in enumerate(audio_files):
-                if os.path.exists(audio_file):
-                    size = os.path.getsize(audio_file)
-                    self.logger.debug(f"Audio {i}: {audio_file} ({size} bytes)")
-                else:
-                    self.logger.warning(f"Audio {i} not found: {audio_file}")
-            
-            concat_cmd = [
-                ffmpeg_exe, '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', audio_list_file.name,
-                '-acodec', 'pcm_s16le',
-                '-ar', '22050',
-                temp_audio
-            ]
-            
-            concat_result = subprocess.run(concat_cmd, capture_output=True, text=True, timeout=60)
-            
-            # Log audio concatenation result
-            if concat_result.returncode == 0 and os.path.exists(temp_audio):
-                self.logger.info(f"Concatenated audio created: {os.path.getsize(temp_audio)} bytes")
-            else:
-                self.logger.error(f"Audio concatenation failed: {concat_result.stderr if concat_result.stderr else 'no error message'}")
-            
-            if concat_result.returncode != 0:
-                self.logger.error(f"Audio concatenation failed: {concat_result.stderr}")
-                os.remove(audio_list_file.name)
-                if os.path.exists(temp_video):
-                    os.remove(temp_video)
-                return False
+                cmd += ['-i', audio_file]
             
-            if not os.path.exists(temp_audio):
-                self.logger.error("Concatenated audio file was not created")
-                os.remove(audio_list_file.name)
-                if os.path.exists(temp_video):
-                    os.remove(temp_video)
-                return False
+            audio_inputs = ''.join(f"[{i + 1}:a]" for i in range(len(audio_files)))
             
-            # Merge video and audio
-            self.logger.info("Merging video and audio...")
-            # Don't use -shortest, let video determine duration
-            final_cmd = [
-                ffmpeg_exe, '-y',
-                '-i', temp_video,
-                '-i', temp_audio,
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-pix_fmt', 'yuv420p',
+            # Don't use -shortest, let video determine the duration
+            # Use map to ensure both streams are included
+            cmd += [
+                '-filter_complex', f"{audio_inputs}concat=n={len(audio_files)}:v=0:a=1[aout]",
                 '-map', '0:v:0',
-                '-map', '1:a:0',
+                '-map', '[aout]',
+                '-c:v', 'copy',
+                # Narration is mono speech: a mono track at a speech bitrate
+                # keeps the AAC encode cheap and stays playable everywhere
+                '-c:a', 'aac',
+                '-ac', '1',
+                '-b:a', '96k',
                 output_path
             ]
             
-            result = subprocess.run(final_cmd, capture_output=True, text=True, timeout=120)
+            self.logger.info(f"Merging {len(audio_files)} audio files with video")
             
-            # Log detailed merge results
-            if result.stdout:
-                self.logger.info(f"Merge command stdout: {result.stdout[:500]}")
-            if result.stderr:
-                self.logger.info(f"Merge command stderr: {result.stderr[:500]}")
-                
-            if result.returncode != 0:
-                self.logger.error(f"Merge command failed with return code: {result.returncode}")
-                if result.stderr:
-                    self.logger.error(f"Full stderr: {result.stderr}")
-            
-            # Check result
-            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-                self.logger.info(f"Successfully created MP4 with audio: {output_path}")
-                
-                # Verify the output has proper duration
-                try:
-                    import imageio
-                    reader = imageio.get_reader(output_path)
-                    output_frames = reader.count_frames()
-                    self.logger.info(f"Output video has {output_frames} frames")
-                    if output_frames < len(frames_list):
-                        self.logger.warning(f"Output video has fewer frames ({output_frames}) than expected ({len(frames_list)})")
-                except Exception as e:
-                    self.logger.debug(f"Could not verify output frames: {e}")
-                
-                # Cleanup temp files
-                if os.path.exists(audio_list_file.name):
-                    os.remove(audio_list_file.name)
-                if os.path.exists(temp_video):
-                    os.remove(temp_video)
-                if os.path.exists(temp_audio):
-                    os.remove(temp_audio)
-                
+            returncode, stderr = _run_ffmpeg(cmd, timeout=120)
+            
+            if returncode == 0 and os.path.exists(output_path):
+                self.logger.info("Successfully merged audio with video")
                 return True
-            else:
-                self.logger.error(f"Audio merge failed: {result.stderr}")
-                # Keep temp files for debugging
-                self.logger.warning("Keeping temp files for debugging")
             
+            self.logger.error(f"Audio merge failed: {stderr[-500:]}")
             return False
-            
+                
         except Exception as e:
-            self.logger.error(f"Failed to add audio track: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            self.logger.error(f"Failed to merge audio: {e}")
             return False
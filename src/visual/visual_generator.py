@@ -2,12 +2,16 @@
 Visual Generator
 Generates or selects visual elements for slides
 """
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from utils.config_manager import ConfigManager
 from utils.logger import Logger
 from utils.image_processor import ImageProcessor
 from utils.text_processor import TextProcessor
+import hashlib
 import os
+import tempfile
+import threading
 
 
 class VisualGenerator:
@@ -29,44 +33,102 @@ class VisualGenerator:
         self.strategy = config.get_value('visuals.strategy', 'simple_generation')
         self.image_width = config.get_value('visuals.image_width', 800)
         self.image_height = config.get_value('visuals.image_height', 600)
+        
+        # Created once here rather than checked for every slide
+        self.image_dir = "temp/images"
+        os.makedirs(self.image_dir, exist_ok=True)
+        
+        # Diagram path per distinct drawing, so repeated keyword sets reuse one PNG.
+        # Each key has its own lock so threads rendering the same diagram wait
+        # for the first one instead of drawing it twice.
+        self._visual_cache: Dict[tuple, str] = {}
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        self._cache_lock = threading.Lock()
     
-    def generate_for_slides(self, slides: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_for_slides(self, slides: List[Dict[str, Any]],
+                            executor: Optional[ThreadPoolExecutor] = None) -> List[Dict[str, Any]]:
         """
         Add visuals to slides
         
         Args:
             slides: List of SlideContent dictionaries
+            executor: Optional thread pool to render slides on in parallel.
+                Threads share this generator and its diagram cache; for
+                process pools use the orchestrator's worker initializer,
+                which builds one generator per process instead of pickling
+                this one for every slide
             
         Returns:
-            List of enriched SlideContent dictionaries
+            List of enriched SlideContent dictionaries, in slide order
+            
+        Raises:
+            TypeError: If executor is not a ThreadPoolExecutor (a process pool
+                would pickle the whole generator for every slide and lose
+                the shared diagram cache)
         """
         self.logger.info(f"Generating visuals for {len(slides)} slides...")
         
-        enriched_slides = []
-        
-        for i, slide in enumerate(slides):
-            # Extract keywords
-            keywords = self._extract_keywords_from_slide(slide)
-            
-            # Generate or select image
-            if self.strategy == 'icon_library':
-                visual_path = self.select_icon(keywords)
-            else:
-                visual_path = self.generate_simple_image(keywords, f"slide_{i+1}")
-            
-            # Add visual to slide
-            slide['visual'] = {
-                'type': self.strategy,
-                'path': visual_path,
-                'keywords_matched': keywords
-            }
-            
-            enriched_slides.append(slide)
+        if executor is not None:
+            if not isinstance(executor, ThreadPoolExecutor):
+                raise TypeError("generate_for_slides only accepts a ThreadPoolExecutor")
+            enriched_slides = list(executor.map(self.generate_for_slide, slides, range(len(slides))))
+        else:
+            enriched_slides = [self.generate_for_slide(slide, i) for i, slide in enumerate(slides)]
         
         self.logger.info("Visual generation complete")
         
         return enriched_slides
     
+    def generate_for_slide(self, slide: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """
+        Add a visual to a single slide
+        
+        Args:
+            slide: SlideContent dictionary
+            index: Zero-based slide position (diagrams are named by content,
+                so this no longer affects the image path)
+            
+        Returns:
+            Enriched SlideContent dictionary
+        """
+        # Extract keywords
+        keywords = self._extract_keywords_from_slide(slide)
+        
+        # Generate or select image
+        if self.strategy == 'icon_library':
+            visual_path = self.select_icon(keywords)
+            exists = os.path.isfile(visual_path)
+        else:
+            # The diagram only draws the first letter of up to five keywords
+            # at the configured size, so slides that agree on those share a
+            # single image
+            key = (
+                tuple(keyword[:1].upper() for keyword in keywords[:5]),
+                self.image_width,
+                self.image_height,
+            )
+            with self._cache_lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                visual_path = self._visual_cache.get(key)
+                if visual_path is None:
+                    # Named by content rather than slide number so a cached path
+                    # can't be overwritten by a later slide or presentation
+                    digest = hashlib.md5(repr(key).encode('utf-8')).hexdigest()[:12]
+                    visual_path = self.generate_simple_image(keywords, f"diagram_{digest}")
+                    self._visual_cache[key] = visual_path
+            exists = True  # Written by this generator
+        
+        # Add visual to slide; 'exists' saves slide assembly a stat per slide
+        slide['visual'] = {
+            'type': self.strategy,
+            'path': visual_path,
+            'exists': exists,
+            'keywords_matched': keywords
+        }
+        
+        return slide
+    
     def _extract_keywords_from_slide(self, slide: Dict[str, Any]) -> List[str]:
         """
         Extract keywords from slide content
@@ -107,19 +169,25 @@ class VisualGenerator:
         Returns:
             Image file path
         """
-        # Create directory for images
-        image_dir = "temp/images"
-        os.makedirs(image_dir, exist_ok=True)
-        
         # Generate simple diagram
         image = self.image_processor.create_simple_diagram(
             keywords,
             size=(self.image_width, self.image_height)
         )
         
-        # Save image
-        image_path = f"{image_dir}/{filename}.png"
-        self.image_processor.convert_to_png(image, image_path)
+        # Save image; written to a uniquely named temp file and renamed into
+        # place so a reader never sees a half-written file when pool workers
+        # (or threads) produce the same diagram
+        image_path = f"{self.image_dir}/{filename}.png"
+        fd, tmp_path = tempfile.mkstemp(dir=self.image_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            self.image_processor.convert_to_png(image, tmp_path, make_dirs=False)
+            os.replace(tmp_path, image_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         
         return image_path
 
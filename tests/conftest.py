@@ -0,0 +1,8 @@
+"""
+Test configuration
+Puts src/ on the import path the same way the CLI does
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,72 @@
+"""
+Configuration Manager tests
+Dotted-key lookups and updates
+"""
+from utils.config_manager import ConfigManager
+
+
+def _manager() -> ConfigManager:
+    return ConfigManager.from_dict({
+        'video': {'fps': 30, 'resolution': {'width': 1920, 'height': 1080}},
+        'analysis': {'max_slides': 10, 'parallel_workers': None},
+    })
+
+
+def test_get_value_nested_keys():
+    config = _manager()
+    assert config.get_value('video.fps') == 30
+    assert config.get_value('video.resolution.width') == 1920
+    assert config.get_value('video.resolution') == {'width': 1920, 'height': 1080}
+
+
+def test_get_value_missing_keys_return_default():
+    config = _manager()
+    assert config.get_value('video.bitrate') is None
+    assert config.get_value('video.bitrate', '5M') == '5M'
+    assert config.get_value('audio.rate', 44100) == 44100
+
+
+def test_get_value_through_non_dict_returns_default():
+    config = _manager()
+    assert config.get_value('video.fps.max', 60) == 60
+    assert config.get_value('video.resolution.width.px', 'n/a') == 'n/a'
+
+
+def test_get_value_keeps_explicit_none():
+    # A key that exists with a null value isn't replaced by the default
+    assert _manager().get_value('analysis.parallel_workers', 4) is None
+
+
+def test_set_value_updates_existing_key():
+    config = _manager()
+    config.set_value('video.fps', 24)
+    assert config.get_value('video.fps') == 24
+    assert config.get_config()['video']['fps'] == 24
+
+
+def test_set_value_creates_sections_and_reindexes():
+    config = _manager()
+    config.set_value('extraction.cache.enabled', False)
+    assert config.get_value('extraction.cache.enabled') is False
+    assert config.get_value('extraction.cache') == {'enabled': False}
+
+
+def test_set_value_replaces_non_dict_parent():
+    config = _manager()
+    config.set_value('video.fps.max', 60)
+    assert config.get_value('video.fps') == {'max': 60}
+    assert config.get_value('video.fps.max') == 60
+
+
+def test_set_value_subtree_is_indexed():
+    config = _manager()
+    config.set_value('video.resolution', {'width': 1280, 'height': 720})
+    assert config.get_value('video.resolution.height') == 720
+
+
+def test_get_value_returns_copies_of_sections():
+    config = _manager()
+    resolution = config.get_value('video.resolution')
+    resolution['width'] = 640
+    assert config.get_value('video.resolution.width') == 1920
+    assert config.get_value('video.resolution') == {'width': 1920, 'height': 1080}
@@ -0,0 +1,205 @@
+"""
+Pipeline Orchestrator tests
+Streaming stage queues, result ordering, aborts and the extraction cache
+"""
+import asyncio
+import os
+import pickle
+import threading
+import time
+
+import pytest
+
+from cli import orchestrator as orch
+from cli.orchestrator import PipelineOrchestrator, EXTRACTION_CACHE_VERSION, _EOF
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+
+
+def _orchestrator(workers: int = 1, **extra) -> PipelineOrchestrator:
+    config = {'analysis': {'parallel_workers': workers}}
+    config.update(extra)
+    return PipelineOrchestrator(ConfigManager.from_dict(config), Logger())
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def _run_pump(pipeline: PipelineOrchestrator, items: list, submit) -> list:
+    async def run():
+        in_queue, out_queue = asyncio.Queue(), asyncio.Queue()
+        for item in items:
+            in_queue.put_nowait(item)
+        in_queue.put_nowait(_EOF)
+        await pipeline._pump(in_queue, out_queue, submit)
+        return _drain(out_queue)
+    
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_pump_keeps_input_order(workers):
+    pipeline = _orchestrator(workers)
+    
+    def submit(item, index):
+        # Later items finish first
+        async def work():
+            await asyncio.sleep(0.01 * (5 - index))
+            return (index, item * 10)
+        return asyncio.ensure_future(work())
+    
+    out = _run_pump(pipeline, [1, 2, 3, 4, 5], submit)
+    
+    assert out[:-1] == [(0, 10), (1, 20), (2, 30), (3, 40), (4, 50)]
+    assert out[-1] is _EOF
+
+
+def test_pump_bounds_work_in_flight():
+    pipeline = _orchestrator(2)
+    in_flight = []
+    peak = []
+    
+    def submit(item, index):
+        async def work():
+            in_flight.append(item)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(item)
+            return item
+        return asyncio.ensure_future(work())
+    
+    out = _run_pump(pipeline, list(range(6)), submit)
+    
+    assert out == list(range(6)) + [_EOF]
+    assert max(peak) <= 2
+
+
+def test_pump_forwards_eof_for_empty_input():
+    out = _run_pump(_orchestrator(3), [], lambda item, index: pytest.fail("nothing to submit"))
+    assert out == [_EOF]
+
+
+def test_iter_queue_stops_at_eof():
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        for item in ('a', 'b', _EOF, 'after'):
+            queue.put_nowait(item)
+        return await loop.run_in_executor(None, list, PipelineOrchestrator._iter_queue(queue, loop))
+    
+    assert asyncio.run(run()) == ['a', 'b']
+
+
+class _FailingSummarizer:
+    def __init__(self, config, logger):
+        pass
+    
+    def summarize_section(self, section):
+        if section['id'] == 2:
+            raise ValueError("summarization failed")
+        return dict(section)
+
+
+class _PassThroughVisuals:
+    def __init__(self, config, logger):
+        pass
+    
+    def generate_for_slide(self, slide, index):
+        return slide
+
+
+class _CollectingAssembler:
+    finished = threading.Event()
+    
+    def __init__(self, config, logger):
+        pass
+    
+    def create_presentation(self, slides, output_path):
+        try:
+            # Consume slowly so the failure lands while this thread is busy
+            for _ in slides:
+                time.sleep(0.05)
+        finally:
+            _CollectingAssembler.finished.set()
+
+
+def test_stage_failure_stops_the_other_stages(monkeypatch, tmp_path):
+    monkeypatch.setattr(orch, 'Summarizer', _FailingSummarizer)
+    monkeypatch.setattr(orch, 'VisualGenerator', _PassThroughVisuals)
+    monkeypatch.setattr(orch, 'SlideAssembler', _CollectingAssembler)
+    
+    pipeline = _orchestrator(1)
+    pipeline._out = tmp_path
+    monkeypatch.setattr(pipeline, '_stage_1_extraction', lambda pdf_path: {})
+    monkeypatch.setattr(pipeline, '_stage_2_analysis', lambda doc: [{'id': i} for i in range(5)])
+    
+    _CollectingAssembler.finished.clear()
+    
+    async def run():
+        with pytest.raises(ValueError, match="summarization failed"):
+            await asyncio.wait_for(pipeline._run_pipeline('unused.pdf'), timeout=10)
+        
+        # Nothing is left waiting on a stage queue once the failure surfaces,
+        # including the assembler thread
+        others = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        assert all(task.done() for task in others)
+        assert _CollectingAssembler.finished.is_set()
+    
+    asyncio.run(run())
+
+
+class _FakeBackend:
+    name = 'fake'
+
+
+class _FakeExtractor:
+    calls = 0
+    
+    def __init__(self, config, logger):
+        self.backend = _FakeBackend()
+    
+    def extract_text_structure(self, pdf_path):
+        _FakeExtractor.calls += 1
+        return {'sections': [{'title': 'Intro'}]}
+
+
+def test_extraction_cache_name_and_reuse(monkeypatch, tmp_path):
+    monkeypatch.setattr(orch, 'PDFExtractor', _FakeExtractor)
+    monkeypatch.setattr(orch.FileManager, 'get_cache_directory', staticmethod(lambda: str(tmp_path)))
+    _FakeExtractor.calls = 0
+    
+    pdf_path = tmp_path / 'doc.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 test')
+    digest = orch.FileManager.file_sha256(str(pdf_path))
+    
+    pipeline = _orchestrator(1)
+    first = pipeline._stage_1_extraction(str(pdf_path))
+    second = pipeline._stage_1_extraction(str(pdf_path))
+    
+    cache_file = tmp_path / f"{digest}_fake_v{EXTRACTION_CACHE_VERSION}.pkl"
+    assert cache_file.exists()
+    assert first == second == {'sections': [{'title': 'Intro'}]}
+    assert _FakeExtractor.calls == 1
+    with open(cache_file, 'rb') as f:
+        assert pickle.load(f) == first
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_extraction_cache_disabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(orch, 'PDFExtractor', _FakeExtractor)
+    monkeypatch.setattr(orch.FileManager, 'get_cache_directory', staticmethod(lambda: str(tmp_path)))
+    _FakeExtractor.calls = 0
+    
+    pdf_path = tmp_path / 'doc.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 test')
+    
+    pipeline = _orchestrator(1, extraction={'cache_enabled': False})
+    pipeline._stage_1_extraction(str(pdf_path))
+    pipeline._stage_1_extraction(str(pdf_path))
+    
+    assert _FakeExtractor.calls == 2
+    assert not list(tmp_path.glob('*.pkl'))
@@ -0,0 +1,100 @@
+"""
+Video Generator tests
+WAV header parsing and per-slide timing
+"""
+import struct
+
+import pytest
+
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from video.video_generator import VideoGenerator, _wav_duration
+
+
+def _wav_bytes(data_size: int, byte_rate: int = 44100, format_tag: int = 1,
+               declared_size: int = None, extra_chunk: bool = False) -> bytes:
+    """Build a minimal WAV file: RIFF header, fmt chunk, optional LIST chunk, data"""
+    fmt = struct.pack('<HHIIHH', format_tag, 1, 22050, byte_rate, 2, 16)
+    chunks = b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+    if extra_chunk:
+        # Odd-sized chunk to exercise word alignment
+        chunks += b'LIST' + struct.pack('<I', 3) + b'abc\x00'
+    size = data_size if declared_size is None else declared_size
+    chunks += b'data' + struct.pack('<I', size) + b'\x00' * data_size
+    return b'RIFF' + struct.pack('<I', 4 + len(chunks)) + b'WAVE' + chunks
+
+
+def _write(tmp_path, name: str, payload: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(payload)
+    return str(path)
+
+
+def test_wav_duration_valid(tmp_path):
+    path = _write(tmp_path, 'two_seconds.wav', _wav_bytes(88200))
+    assert _wav_duration(path) == pytest.approx(2.0)
+
+
+def test_wav_duration_skips_other_chunks(tmp_path):
+    path = _write(tmp_path, 'list.wav', _wav_bytes(44100, extra_chunk=True))
+    assert _wav_duration(path) == pytest.approx(1.0)
+
+
+def test_wav_duration_unset_data_size_uses_file_size(tmp_path):
+    path = _write(tmp_path, 'streamed.wav', _wav_bytes(44100, declared_size=0xFFFFFFFF))
+    assert _wav_duration(path) == pytest.approx(1.0)
+
+
+def test_wav_duration_truncated_data_uses_file_size(tmp_path):
+    payload = _wav_bytes(88200)[:-44100]
+    path = _write(tmp_path, 'cut.wav', payload)
+    assert _wav_duration(path) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('payload', [
+    b'RIFF\x00\x00',                          # header cut short
+    _wav_bytes(100)[:28],                     # fmt chunk cut short
+    _wav_bytes(100)[:36],                     # no data chunk
+    b'RIFF\x00\x00\x00\x00AVI LIST',          # not a WAV
+])
+def test_wav_duration_rejects_broken_files(tmp_path, payload):
+    path = _write(tmp_path, 'broken.wav', payload)
+    with pytest.raises(ValueError):
+        _wav_duration(path)
+
+
+def test_wav_duration_rejects_compressed_formats(tmp_path):
+    # 0x0002 is MS ADPCM, whose byte rate is only an average
+    path = _write(tmp_path, 'adpcm.wav', _wav_bytes(100, format_tag=0x0002))
+    with pytest.raises(ValueError):
+        _wav_duration(path)
+
+
+def test_slide_timing_clamps_to_min_duration(tmp_path):
+    config = ConfigManager.from_dict({'video': {'min_slide_duration': 5}})
+    generator = VideoGenerator(config, Logger())
+    
+    long_clip = _write(tmp_path, 'long.wav', _wav_bytes(44100 * 7))
+    short_clip = _write(tmp_path, 'short.wav', _wav_bytes(44100))
+    broken_clip = _write(tmp_path, 'broken.wav', b'not audio')
+    
+    narration = ['Long.', 'Short.', 'No audio.', 'Broken.']
+    timing = list(generator._iter_slide_timing(narration, [long_clip, short_clip, None, broken_clip]))
+    
+    assert timing == [
+        (long_clip, pytest.approx(7.0)),
+        (short_clip, 5),
+        (None, 5),
+        (broken_clip, 5),
+    ]
+
+
+def test_blank_slides_get_no_duration_or_frames(tmp_path):
+    generator = VideoGenerator(ConfigManager.from_dict({'video': {'min_slide_duration': 5}}), Logger())
+    clip = _write(tmp_path, 'clip.wav', _wav_bytes(44100))
+    
+    # Blank narration wins even if a stale audio path is passed along
+    timing = list(generator._iter_slide_timing(['', '   \n', 'Spoken.'], [None, clip, clip]))
+    
+    assert timing == [(None, 0), (None, 0), (clip, 5)]
+    assert list(generator._create_slide_frames('', [], 0, generator.fps)) == []
@@ -0,0 +1,79 @@
+"""
+Visual Generator tests
+Diagram reuse across slides and threads
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from utils.config_manager import ConfigManager
+from utils.logger import Logger
+from visual.visual_generator import VisualGenerator
+
+
+def _generator(monkeypatch, tmp_path) -> VisualGenerator:
+    # Images go to temp/images under the working directory
+    monkeypatch.chdir(tmp_path)
+    return VisualGenerator(ConfigManager.from_dict({}), Logger())
+
+
+def test_matching_slides_share_one_diagram_across_threads(monkeypatch, tmp_path):
+    generator = _generator(monkeypatch, tmp_path)
+    
+    renders = []
+    render = generator.generate_simple_image
+    monkeypatch.setattr(generator, 'generate_simple_image',
+                        lambda keywords, filename: renders.append(filename) or render(keywords, filename))
+    monkeypatch.setattr(generator, '_extract_keywords_from_slide', lambda slide: ['alpha', 'beta'])
+    
+    slides = [{'title': f'Slide {i}'} for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        enriched = list(executor.map(generator.generate_for_slide, slides, range(len(slides))))
+    
+    paths = {slide['visual']['path'] for slide in enriched}
+    assert len(renders) == 1
+    assert len(paths) == 1
+    
+    path = paths.pop()
+    with Image.open(path) as image:
+        image.verify()
+    assert not [name for name in os.listdir(generator.image_dir) if name.endswith('.tmp')]
+
+
+def test_diagram_key_includes_image_size(monkeypatch, tmp_path):
+    generator = _generator(monkeypatch, tmp_path)
+    monkeypatch.setattr(generator, '_extract_keywords_from_slide', lambda slide: ['alpha'])
+    
+    small = generator.generate_for_slide({'title': 'A'}, 0)['visual']['path']
+    generator.image_width, generator.image_height = 400, 300
+    large = generator.generate_for_slide({'title': 'A'}, 1)['visual']['path']
+    
+    assert small != large
+    with Image.open(large) as image:
+        assert image.size == (400, 300)
+
+
+def test_generate_for_slides_on_threads_keeps_order(monkeypatch, tmp_path):
+    generator = _generator(monkeypatch, tmp_path)
+    slides = [{'title': f'Topic {name}', 'bullets': []} for name in ('Apple', 'Banana', 'Cherry', 'Apple')]
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        enriched = generator.generate_for_slides(slides, executor=executor)
+    
+    assert [slide['title'] for slide in enriched] == [slide['title'] for slide in slides]
+    assert all(slide['visual']['exists'] for slide in enriched)
+    assert enriched[0]['visual']['path'] == enriched[3]['visual']['path']
+
+
+def test_generate_for_slides_rejects_process_pools(monkeypatch, tmp_path):
+    generator = _generator(monkeypatch, tmp_path)
+    
+    # No work is submitted, so no worker processes are started
+    executor = ProcessPoolExecutor(max_workers=1)
+    try:
+        with pytest.raises(TypeError):
+            generator.generate_for_slides([{'title': 'Slide'}], executor=executor)
+    finally:
+        executor.shutdown()